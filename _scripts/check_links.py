@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+check_links.py — Concurrent, cached checker for the links the generator emits.
+
+``generate_pages.py`` writes DOI, ResearchSquare, arXiv, CRAN, GitHub and pkgdown URLs
+into the ``_includes/`` partials and the ``publications/<key>/`` detail pages, and
+nothing verifies them.  This script takes the ``doi``, ``url`` and ``eprint`` links
+straight from the bib entries, adds every ``href``/``src`` attribute and markdown link
+in the generated output (and, when present, the rendered ``docs/``), then checks them
+concurrently:
+
+- one ``asyncio`` event loop, plain ``asyncio`` streams (no third-party client);
+- a bounded connection pool (``--connections`` requests in flight, keep-alive reuse
+  per host);
+- a per-host rate limit (``--per-host`` parallel requests, ``--interval`` seconds
+  between requests to the same host);
+- ``HEAD`` first, falling back to ``GET`` for servers that reject ``HEAD``;
+  redirects are followed;
+- an on-disk result cache (``_cache/link_check.json``) with a TTL, so reruns only
+  touch new or expired URLs.  Broken results are never cached.
+
+Namespace URIs (``xmlns``) and ``preconnect``/``dns-prefetch`` hints are not links and
+are skipped.  Local links need no network: every bib ``file`` field and every
+``CVShrikrishnaBhat/`` link in the generated output is looked up in a one-off index
+of the CV directory — links in the rendered ``docs/`` against its own copy, whose
+files may carry fingerprinted names.
+
+Works against any HTTP server, including a local stand-in for testing::
+
+    python -m http.server 8000 &
+    python _scripts/check_links.py --url http://127.0.0.1:8000/ --no-cache
+
+Usage:
+    python _scripts/check_links.py [--ttl HOURS] [--connections N] [--per-host N]
+                                   [--interval SECONDS] [--timeout SECONDS]
+                                   [--no-cache] [--url URL ...]
+
+Exits with status 1 if any link is broken.
+"""
+
+import argparse
+import asyncio
+import html
+import json
+import re
+import ssl
+import sys
+import time
+from pathlib import Path
+from urllib.parse import unquote, urljoin, urlsplit
+
+from generate_pages import BIB_FILE, CV_DIR, INCLUDES_DIR, PROJECT_DIR, PUB_PAGES_DIR, parse_bib
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+OUTPUT_DIR = PROJECT_DIR / "docs"
+CACHE_FILE = PROJECT_DIR / "_cache" / "link_check.json"
+
+USER_AGENT = "kskbhat.github.io-linkcheck/1.0 (+https://kskbhat.github.io)"
+MAX_REDIRECTS = 5
+
+# Hosts answering bots with these codes are reported as warnings, not failures
+BLOCKED_STATUSES = {401, 403, 429, 999}
+
+DOI_URL = "https://doi.org/{}"
+# bib ``eprinttype`` → URL template, as linked by generate_pages.py
+EPRINT_URLS = {
+    "researchsquare": "https://www.researchsquare.com/article/{}",
+    "arxiv": "https://arxiv.org/abs/{}",
+    "cran": "https://cran.r-project.org/package={}",
+    "github": "https://github.com/{}",
+}
+
+# href/src attribute values (HTML, and raw HTML inside the markdown partials)
+_ATTR_URL_RE = re.compile(
+    r"""\b(?:href|src)\s*=\s*(?:"(https?://[^"]+)"|'(https?://[^']+)'|(https?://[^\s"'>]+))""",
+    re.IGNORECASE,
+)
+# Markdown links ``[text](url "title")`` and autolinks ``<url>``; one level of
+# balanced parentheses is allowed, as in DOIs like ``10.1016/0167-9473(94)00012-3``
+_MD_URL_RE = re.compile(
+    r"""\]\(\s*(https?://(?:[^\s()]|\([^\s()]*\))+)(?:\s+"[^"]*")?\s*\)"""
+    r"""|<(https?://[^\s<>]+)>"""
+)
+# URLs that are identifiers or connection hints, not resources to fetch
+_NOT_A_LINK_RE = re.compile(
+    r"""\bxmlns(?::[\w-]+)?\s*=\s*["'][^"']*["']"""
+    r"""|<link\b[^>]*\brel\s*=\s*["']?(?:preconnect|dns-prefetch)\b[^>]*>""",
+    re.IGNORECASE,
+)
+_LOCAL_CV_RE = re.compile(r"""(?:\.\./)*CVShrikrishnaBhat/([^"'<>()\]\n]+?\.\w+)(?=[)"'\]\s#?]|$)""")
+
+
+# ---------------------------------------------------------------------------
+# Link collection
+# ---------------------------------------------------------------------------
+
+def generated_files() -> list[Path]:
+    """Generator output (partials + detail pages) and the rendered HTML, if any."""
+    files = sorted(INCLUDES_DIR.glob("*.md")) + sorted(PUB_PAGES_DIR.glob("*/index.qmd"))
+    if OUTPUT_DIR.is_dir():
+        files += sorted(OUTPUT_DIR.rglob("*.html"))
+    return files
+
+
+def bib_links(entries: list[dict]) -> dict[str, set[str]]:
+    """``doi``, ``url`` and ``eprint`` links of every bib entry → ``{url: sources}``."""
+    external: dict[str, set[str]] = {}
+    for entry in entries:
+        source = f"{BIB_FILE.name}: {entry['_key']}"
+        urls = []
+        doi = entry.get("doi", "").strip()
+        if doi:
+            urls.append(doi if doi.startswith(("http://", "https://")) else DOI_URL.format(doi))
+        url = entry.get("url", "").strip()
+        if url.startswith(("http://", "https://")):
+            urls.append(url)
+        template = EPRINT_URLS.get(entry.get("eprinttype", "").lower())
+        if template and entry.get("eprint"):
+            urls.append(template.format(entry["eprint"].strip()))
+        for url in urls:
+            external.setdefault(url, set()).add(source)
+    return external
+
+
+def collect_links(files: list[Path]) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
+    """Return ``(external url → sources, local CV path → sources)``.
+
+    External URLs come from ``href``/``src`` attributes and markdown links, never from
+    running text.  Local paths are relative to PROJECT_DIR: ``CVShrikrishnaBhat/…``
+    for generator output, ``docs/CVShrikrishnaBhat/…`` for rendered pages.
+    """
+    external: dict[str, set[str]] = {}
+    local: dict[str, set[str]] = {}
+    for path in files:
+        text = _NOT_A_LINK_RE.sub("", path.read_text(encoding="utf-8", errors="replace"))
+        source = str(path.relative_to(PROJECT_DIR))
+        cv_root = _cv_root(path).relative_to(PROJECT_DIR).as_posix()
+        found = [u for m in _ATTR_URL_RE.finditer(text) for u in m.groups() if u]
+        if path.suffix != ".html":
+            found += [u for m in _MD_URL_RE.finditer(text) for u in m.groups() if u]
+        for url in found:
+            external.setdefault(html.unescape(url), set()).add(source)
+        for rel in _LOCAL_CV_RE.findall(text):
+            local.setdefault(f"{cv_root}/{unquote(rel)}", set()).add(source)
+    return external, local
+
+
+def _cv_root(path: Path) -> Path:
+    """The CV tree that links in *path* point into (the rendered copy for docs/)."""
+    if OUTPUT_DIR in path.parents:
+        return OUTPUT_DIR / CV_DIR.name
+    return CV_DIR
+
+
+def check_local_files(
+    entries: list[dict], local: dict[str, set[str]]
+) -> list[tuple[str, str]]:
+    """Validate bib ``file`` fields and CV links against one index of the CV trees."""
+    index = {
+        p.relative_to(PROJECT_DIR).as_posix()
+        for root in (CV_DIR, OUTPUT_DIR / CV_DIR.name)
+        for p in root.rglob("*") if p.is_file()
+    }
+    missing: list[tuple[str, str]] = []
+    for entry in entries:
+        rel = entry.get("file", "")
+        if rel and f"{CV_DIR.name}/{rel}" not in index:
+            missing.append((f"{CV_DIR.name}/{rel}", f"{BIB_FILE.name}: {entry['_key']}"))
+    for rel, sources in sorted(local.items()):
+        if rel not in index:
+            missing.append((rel, ", ".join(sorted(sources))))
+    return missing
+
+
+# ---------------------------------------------------------------------------
+# Connection pool & per-host limits
+# ---------------------------------------------------------------------------
+
+class ConnectionPool:
+    """Keep-alive connections, at most *limit* in use at once across all hosts.
+
+    Idle keep-alive connections waiting for reuse do not count against *limit*.
+    """
+
+    def __init__(self, limit: int, timeout: float):
+        self._slots = asyncio.Semaphore(limit)
+        self._idle: dict[tuple, list[tuple]] = {}
+        self._timeout = timeout
+        self._ssl = ssl.create_default_context()
+
+    async def acquire(self, scheme: str, host: str, port: int, fresh: bool = False):
+        """Return ``(reader, writer, reused)`` to *host*.
+
+        An idle connection is reused unless *fresh* is set.
+        """
+        await self._slots.acquire()
+        idle = self._idle.get((scheme, host, port), [])
+        while idle and not fresh:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    host, port, ssl=self._ssl if scheme == "https" else None
+                ),
+                self._timeout,
+            )
+            return reader, writer, False
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, key: tuple, reader, writer, reusable: bool) -> None:
+        """Return a connection to the pool (or close it) and free its slot."""
+        if reusable and not writer.is_closing():
+            self._idle.setdefault(key, []).append((reader, writer))
+        else:
+            writer.close()
+        self._slots.release()
+
+    def close(self) -> None:
+        for conns in self._idle.values():
+            for _, writer in conns:
+                writer.close()
+        self._idle.clear()
+
+
+class HostLimiter:
+    """At most *per_host* requests in flight per host, spaced *interval* seconds apart."""
+
+    def __init__(self, per_host: int, interval: float):
+        self._per_host = per_host
+        self._interval = interval
+        self._sems: dict[str, asyncio.Semaphore] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._last: dict[str, float] = {}
+
+    def slot(self, host: str) -> asyncio.Semaphore:
+        return self._sems.setdefault(host, asyncio.Semaphore(self._per_host))
+
+    async def wait_turn(self, host: str) -> None:
+        """Sleep until *host* may receive its next request."""
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            delay = self._last.get(host, 0.0) + self._interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last[host] = time.monotonic()
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+async def _request(
+    pool: ConnectionPool, limiter: HostLimiter, method: str, url: str, timeout: float
+) -> tuple[int, dict[str, str]]:
+    """Send one request and return ``(status, headers)``; the body is never read."""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = parts.hostname or ""
+    port = parts.port or (443 if scheme == "https" else 80)
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+    host_header = host if parts.port is None else f"{host}:{parts.port}"
+
+    async with limiter.slot(host):
+        await limiter.wait_turn(host)
+        key = (scheme, host, port)
+        for fresh in (False, True):
+            reader, writer, reused = await pool.acquire(scheme, host, port, fresh=fresh)
+            reusable = False
+            try:
+                keep_alive = method == "HEAD"
+                writer.write(
+                    (
+                        f"{method} {target} HTTP/1.1\r\n"
+                        f"Host: {host_header}\r\n"
+                        f"User-Agent: {USER_AGENT}\r\n"
+                        "Accept: */*\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    ).encode("latin-1")
+                )
+                await writer.drain()
+                status_line = await asyncio.wait_for(reader.readline(), timeout)
+                if not status_line:
+                    raise ConnectionError("empty response")
+                version, status = status_line.split()[:2]
+                status = int(status)
+                headers: dict[str, str] = {}
+                while True:
+                    line = await asyncio.wait_for(reader.readline(), timeout)
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                # HTTP/1.1 keeps the connection open unless told otherwise; HTTP/1.0
+                # closes it unless the server explicitly agrees to keep-alive
+                connection = headers.get("connection", "").lower()
+                persistent = connection == "keep-alive" or (
+                    version == b"HTTP/1.1" and connection != "close"
+                )
+                reusable = keep_alive and persistent
+                return status, headers
+            except ConnectionError:
+                # The server closed an idle keep-alive connection; retry once on a new one
+                if not reused:
+                    raise
+            finally:
+                pool.release(key, reader, writer, reusable)
+
+
+async def check_url(
+    pool: ConnectionPool, limiter: HostLimiter, url: str, timeout: float
+) -> dict:
+    """Check one URL (HEAD, then GET on rejection), following redirects."""
+    current = url
+    try:
+        for _ in range(MAX_REDIRECTS + 1):
+            status, headers = await _request(pool, limiter, "HEAD", current, timeout)
+            if status in (400, 403, 404, 405, 501):
+                status, headers = await _request(pool, limiter, "GET", current, timeout)
+            if 300 <= status < 400 and "location" in headers:
+                current = urljoin(current, headers["location"])
+                continue
+            break
+        else:
+            return {"status": status, "result": "broken", "error": "too many redirects"}
+    except (OSError, asyncio.TimeoutError, ValueError, IndexError, ssl.SSLError) as exc:
+        return {"status": 0, "result": "broken", "error": f"{type(exc).__name__}: {exc}"}
+
+    if 200 <= status < 300:
+        result = "ok"
+    elif status in BLOCKED_STATUSES:
+        result = "blocked"
+    else:
+        result = "broken"
+    record = {"status": status, "result": result}
+    if current != url:
+        record["final_url"] = current
+    return record
+
+
+async def check_all(
+    urls: list[str],
+    cache: dict[str, dict],
+    ttl: float,
+    connections: int = 8,
+    per_host: int = 2,
+    interval: float = 0.5,
+    timeout: float = 15.0,
+) -> dict[str, dict]:
+    """Check *urls* concurrently; fresh entries in *cache* are reused, not re-fetched."""
+    now = time.time()
+    results: dict[str, dict] = {}
+    pending: list[str] = []
+    for url in urls:
+        hit = cache.get(url)
+        if hit and now - hit.get("checked", 0) < ttl:
+            results[url] = {**hit, "cached": True}
+        else:
+            pending.append(url)
+
+    pool = ConnectionPool(connections, timeout)
+    limiter = HostLimiter(per_host, interval)
+    try:
+        checked = await asyncio.gather(
+            *(check_url(pool, limiter, url, timeout) for url in pending)
+        )
+    finally:
+        pool.close()
+
+    for url, record in zip(pending, checked):
+        record["checked"] = now
+        results[url] = record
+        if record["result"] != "broken":
+            cache[url] = record
+        else:
+            cache.pop(url, None)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+def load_cache(path: Path = CACHE_FILE) -> dict[str, dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache: dict[str, dict], path: Path = CACHE_FILE) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point — check local files and external links, print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--ttl", type=float, default=24.0,
+                        help="hours a cached ok/blocked result stays valid (default 24)")
+    parser.add_argument("--connections", type=int, default=8,
+                        help="maximum open connections overall (default 8)")
+    parser.add_argument("--per-host", type=int, default=2,
+                        help="maximum parallel requests per host (default 2)")
+    parser.add_argument("--interval", type=float, default=0.5,
+                        help="minimum seconds between requests to one host (default 0.5)")
+    parser.add_argument("--timeout", type=float, default=15.0,
+                        help="per-request timeout in seconds (default 15)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="ignore and do not update the on-disk result cache")
+    parser.add_argument("--url", action="append", default=[],
+                        help="check only this URL (repeatable); skips collection")
+    args = parser.parse_args(argv)
+
+    broken = 0
+    if args.url:
+        external = {url: {"--url"} for url in args.url}
+    else:
+        entries = parse_bib(BIB_FILE)
+        external, local = collect_links(generated_files())
+        for url, sources in bib_links(entries).items():
+            external.setdefault(url, set()).update(sources)
+        missing = check_local_files(entries, local)
+        for rel, source in missing:
+            print(f"[check_links] MISSING  {rel}  ({source})")
+        broken += len(missing)
+        print(f"[check_links] {len(local)} local CV links checked, {len(missing)} missing")
+
+    cache = {} if args.no_cache else load_cache()
+    started = time.monotonic()
+    results = asyncio.run(check_all(
+        sorted(external), cache, args.ttl * 3600,
+        connections=args.connections, per_host=args.per_host,
+        interval=args.interval, timeout=args.timeout,
+    ))
+    elapsed = time.monotonic() - started
+    if not args.no_cache:
+        save_cache(cache)
+
+    counts = {"ok": 0, "blocked": 0, "broken": 0}
+    for url, r in sorted(results.items()):
+        counts[r["result"]] += 1
+        if r["result"] == "ok":
+            continue
+        detail = r.get("error") or f"HTTP {r['status']}"
+        label = "BROKEN " if r["result"] == "broken" else "BLOCKED"
+        print(f"[check_links] {label}  {url}  {detail}  ({', '.join(sorted(external[url]))})")
+    n_cached = sum(1 for r in results.values() if r.get("cached"))
+    print(
+        f"[check_links] {len(results)} URLs in {elapsed:.1f}s "
+        f"({n_cached} from cache): {counts['ok']} ok, "
+        f"{counts['blocked']} blocked by host, {counts['broken']} broken"
+    )
+    broken += counts["broken"]
+    return 1 if broken else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
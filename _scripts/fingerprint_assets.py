@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+fingerprint_assets.py — Give static assets in docs/ content-hashed file names.
+
+Assets such as ``styles.css``, ``pp.png``, ``posts/*/thumbnail.png``, the site_libs
+bundles and the CV PDFs keep stable names, so browsers must revalidate them on every
+visit and may serve stale copies after a deploy.  This post-render step:
+
+1. Renames every static asset referenced by the site's HTML, XML or CSS to ``<stem>.<hash>.<ext>`` (fonts and images first, then
+   stylesheets after their ``url()`` references have been rewritten, so a changed font
+   also changes the hash of the CSS that loads it).  PDFs are copied instead of renamed
+   because they are linked from outside the site.
+2. Rewrites the references in every HTML/XML file — attributes, inline scripts and
+   absolute ``site-url`` links alike.
+3. Writes ``docs/asset-manifest.json`` (original → fingerprinted path) and a
+   ``docs/_headers`` file marking fingerprinted paths as immutable for hosts that read
+   it (Netlify, Cloudflare Pages).
+
+Re-running over an already fingerprinted site is a no-op; fingerprinted files that
+neither the manifest nor any page references any more are removed.
+
+Usage:
+    python _scripts/fingerprint_assets.py
+
+Runs automatically via Quarto's post-render hook (see _quarto.yml).
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+from generate_pages import PROJECT_DIR, write_if_changed
+from update_sitemap import read_site_config
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+OUTPUT_DIR = PROJECT_DIR / "docs"
+MANIFEST_FILE = OUTPUT_DIR / "asset-manifest.json"
+HEADERS_FILE = OUTPUT_DIR / "_headers"
+
+# Leaf assets (no references to other assets) and stylesheets, hashed in that order
+LEAF_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico",
+                 ".woff", ".woff2", ".ttf", ".js", ".pdf")
+STYLE_SUFFIXES = (".css",)
+
+# Linked from outside the site (e-mails, CV listings) — keep the original as well
+KEEP_ORIGINAL_SUFFIXES = (".pdf",)
+
+# Files that reference assets and get rewritten
+TEXT_SUFFIXES = (".html", ".xml")
+
+HASH_LENGTH = 10
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+_HASHED_RE = re.compile(rf"\.[0-9a-f]{{{HASH_LENGTH}}}\.[A-Za-z0-9]+$")
+
+_ASSET_EXT = "|".join(s.lstrip(".") for s in LEAF_SUFFIXES + STYLE_SUFFIXES)
+# A quoted reference: "path/to/file.ext?query#frag" (attributes, JS strings, XML)
+_QUOTED_REF_RE = re.compile(
+    rf"""(["'])([^"'<>\n]+?\.(?:{_ASSET_EXT}))([?#][^"'<>\n]*)?\1""", re.IGNORECASE
+)
+# An unquoted CSS url(...)
+_CSS_URL_RE = re.compile(
+    rf"""url\(\s*([^"')\s]+?\.(?:{_ASSET_EXT}))([?#][^"')\s]*)?\s*\)""", re.IGNORECASE
+)
+
+
+def is_fingerprinted(name: str) -> bool:
+    """True if *name* already carries a content hash (``name.<hash>.ext``)."""
+    return bool(_HASHED_RE.search(name))
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(path: Path, data: bytes) -> Path:
+    """``dir/name.ext`` → ``dir/name.<hash>.ext``."""
+    return path.with_name(f"{path.stem}.{content_hash(data)}{path.suffix}")
+
+
+# ---------------------------------------------------------------------------
+# Reference rewriting
+# ---------------------------------------------------------------------------
+
+def _resolve(ref: str, base_dir: Path, site_url: str) -> Path | None:
+    """Resolve a reference to an absolute path inside OUTPUT_DIR (None if external)."""
+    if site_url and ref.startswith(site_url + "/"):
+        return (OUTPUT_DIR / unquote(ref[len(site_url) + 1 :])).resolve()
+    if re.match(r"^(?:[a-z][a-z0-9+.-]*:|//|#)", ref, re.IGNORECASE):
+        return None
+    if ref.startswith("/"):
+        return (OUTPUT_DIR / unquote(ref.lstrip("/"))).resolve()
+    return (base_dir / unquote(ref)).resolve()
+
+
+def _renamed_ref(ref: str, target: Path) -> str:
+    """Swap the last path segment of *ref* for *target*'s name, keeping its encoding."""
+    head, _, last = ref.rpartition("/")
+    name = target.name if unquote(last) == last else quote(target.name)
+    return f"{head}/{name}" if head or ref.startswith("/") else name
+
+
+def rewrite_refs(text: str, base_dir: Path, mapping: dict[Path, Path], site_url: str) -> str:
+    """Rewrite every reference in *text* that resolves to a key of *mapping*."""
+    def _sub_quoted(m: re.Match) -> str:
+        target = mapping.get(_resolve(m.group(2), base_dir, site_url))
+        if target is None:
+            return m.group(0)
+        q = m.group(1)
+        return f"{q}{_renamed_ref(m.group(2), target)}{m.group(3) or ''}{q}"
+
+    def _sub_url(m: re.Match) -> str:
+        target = mapping.get(_resolve(m.group(1), base_dir, site_url))
+        if target is None:
+            return m.group(0)
+        return f"url({_renamed_ref(m.group(1), target)}{m.group(2) or ''})"
+
+    return _CSS_URL_RE.sub(_sub_url, _QUOTED_REF_RE.sub(_sub_quoted, text))
+
+
+# ---------------------------------------------------------------------------
+# Fingerprinting
+# ---------------------------------------------------------------------------
+
+def referenced_assets(site_url: str) -> set[Path]:
+    """Every local file referenced from an HTML, XML or CSS file in OUTPUT_DIR.
+
+    Assets nobody links to (e.g. extra CV resources shared by direct URL) are
+    left under their original names.
+    """
+    refs: set[Path] = set()
+    for path in OUTPUT_DIR.rglob("*"):
+        if path.suffix.lower() not in TEXT_SUFFIXES + STYLE_SUFFIXES:
+            continue
+        text = path.read_text(encoding="utf-8", errors="replace")
+        base_dir = path.parent.resolve()
+        for m in _QUOTED_REF_RE.finditer(text):
+            refs.add(_resolve(m.group(2), base_dir, site_url))
+        for m in _CSS_URL_RE.finditer(text):
+            refs.add(_resolve(m.group(1), base_dir, site_url))
+    refs.discard(None)
+    return refs
+
+
+def _candidates(suffixes: tuple[str, ...], referenced: set[Path]) -> list[Path]:
+    return sorted(
+        p for p in referenced
+        if p.suffix.lower() in suffixes and p.is_file() and not is_fingerprinted(p.name)
+    )
+
+
+def _emit(src: Path, data: bytes, mapping: dict[Path, Path]) -> None:
+    """Write *data* under its fingerprinted name and drop *src* unless it is kept."""
+    dst = hashed_name(src, data)
+    if not dst.is_file():
+        dst.write_bytes(data)
+    if src.suffix.lower() not in KEEP_ORIGINAL_SUFFIXES and src != dst:
+        src.unlink()
+    mapping[src] = dst
+
+
+def fingerprint(site_url: str, previous: dict[str, str]) -> dict[Path, Path]:
+    """Fingerprint all assets; return ``{original path: fingerprinted path}``."""
+    mapping: dict[Path, Path] = {}
+
+    # Carry over assets fingerprinted by an earlier run whose pages were not
+    # re-rendered (their original is gone, or was kept alongside on purpose)
+    for orig, hashed in previous.items():
+        src, dst = (OUTPUT_DIR / orig).resolve(), (OUTPUT_DIR / hashed).resolve()
+        if dst.is_file() and (not src.exists() or src.suffix.lower() in KEEP_ORIGINAL_SUFFIXES):
+            mapping[src] = dst
+
+    referenced = referenced_assets(site_url)
+    for src in _candidates(LEAF_SUFFIXES, referenced):
+        _emit(src, src.read_bytes(), mapping)
+
+    for src in _candidates(STYLE_SUFFIXES, referenced):
+        css = src.read_text(encoding="utf-8")
+        css = rewrite_refs(css, src.parent, mapping, site_url)
+        _emit(src, css.encode("utf-8"), mapping)
+
+    return mapping
+
+
+def write_headers(mapping: dict[Path, Path], path: Path = HEADERS_FILE) -> None:
+    """Write a ``_headers`` file marking every fingerprinted asset immutable."""
+    lines: list[str] = []
+    for dst in sorted(set(mapping.values())):
+        lines.append("/" + quote(dst.relative_to(OUTPUT_DIR.resolve()).as_posix()))
+        lines.append(f"  Cache-Control: {IMMUTABLE}")
+    write_if_changed(path, "\n".join(lines) + "\n")
+
+
+def remove_stale(mapping: dict[Path, Path], site_url: str) -> int:
+    """Delete fingerprinted files that neither the manifest nor any page still uses.
+
+    Pages that were not re-rendered keep pointing at the hashes of an earlier
+    run (e.g. a ``*.purged.<hash>.css`` built for a different token set), so a
+    file is only stale once no HTML, XML or CSS file references it.
+    """
+    keep = set(mapping.values()) | referenced_assets(site_url)
+    removed = 0
+    for path in sorted(OUTPUT_DIR.resolve().rglob("*")):
+        if is_fingerprinted(path.name) and path not in keep and path.is_file():
+            path.unlink()
+            removed += 1
+    return removed
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    """Entry point — fingerprint assets, rewrite pages, write manifest and headers."""
+    if not OUTPUT_DIR.is_dir():
+        print(f"[fingerprint_assets] {OUTPUT_DIR.name}/ not found; render the site first")
+        return
+
+    site_url, _ = read_site_config()
+    try:
+        previous = json.loads(MANIFEST_FILE.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        previous = {}
+
+    mapping = fingerprint(site_url, previous)
+
+    rewritten = 0
+    for page in sorted(p for p in OUTPUT_DIR.rglob("*") if p.suffix.lower() in TEXT_SUFFIXES):
+        text = page.read_text(encoding="utf-8")
+        if write_if_changed(page, rewrite_refs(text, page.parent.resolve(), mapping, site_url)):
+            rewritten += 1
+
+    root = OUTPUT_DIR.resolve()
+    manifest = {
+        src.relative_to(root).as_posix(): dst.relative_to(root).as_posix()
+        for src, dst in sorted(mapping.items())
+    }
+    write_if_changed(MANIFEST_FILE, json.dumps(manifest, indent=1, ensure_ascii=False) + "\n")
+    write_headers(mapping)
+    removed = remove_stale(mapping, site_url)
+
+    print(f"[fingerprint_assets] {len(mapping)} assets fingerprinted, "
+          f"{rewritten} pages rewritten, {removed} stale files removed")
+    print(f"[fingerprint_assets]   → {MANIFEST_FILE.relative_to(PROJECT_DIR)}")
+    print(f"[fingerprint_assets]   → {HEADERS_FILE.relative_to(PROJECT_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,15 +14,25 @@ Keywords used:
     part     → Workshops/conferences attended (participation)
 
 Usage:
-    python _scripts/generate_pages.py
+    python _scripts/generate_pages.py                          # everything
+    python _scripts/generate_pages.py --only software,conferences
+    python _scripts/generate_pages.py --partials-only          # no detail pages
+    python _scripts/generate_pages.py --pages-only             # detail pages only
+    python _scripts/generate_pages.py --key bhat2024silhouette # one entry's outputs
+    python _scripts/generate_pages.py --lint                   # check reference.bib
+
+Files whose content is unchanged are never rewritten.
 
 Runs automatically via Quarto's pre-render hook (see _quarto.yml).
 """
 
+import hashlib
 import re
-import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Callable, NamedTuple, Optional
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -31,6 +41,10 @@ SCRIPT_DIR = Path(__file__).parent
 PROJECT_DIR = SCRIPT_DIR.parent
 BIB_FILE = PROJECT_DIR / "reference.bib"
 INCLUDES_DIR = PROJECT_DIR / "_includes"
+EXPORT_FILE = INCLUDES_DIR / "bibliography.json"
+MANIFEST_FILE = INCLUDES_DIR / "publications_manifest.json"
+STATS_FILE = INCLUDES_DIR / "research_stats.json"
+STATS_CACHE_FILE = PROJECT_DIR / "_cache" / "research_stats.json"
 
 # Author name to bold in outputs
 BOLD_NAME = "Shrikrishna Bhat Kapu"
@@ -39,48 +53,198 @@ BOLD_NAME = "Shrikrishna Bhat Kapu"
 # BibTeX Parser (self-contained, no external dependencies)
 # ---------------------------------------------------------------------------
 
-def parse_bib(bib_path: Path) -> list[dict]:
+# Fields every entry of a keyword must carry; a tuple means "any one of"
+REQUIRED_FIELDS: dict[str, tuple] = {
+    "pub": ("title", "author", ("date", "year")),
+    "software": ("title", "author", ("date", "year")),
+    "present": ("title", ("booktitle", "howpublished"), "date"),
+    "poster": ("title", ("booktitle", "howpublished"), "date"),
+    "part": ("title", ("booktitle", "howpublished"), "date"),
+    "education": ("title", "institution", "date"),
+    "experience": ("title", "institution", "date"),
+}
+
+_ENTRY_HEAD_RE = re.compile(r"@(\w+)\{\s*([^,\s]+)\s*,")
+# @comment{...}, @string{name = "value"} and @preamble{...} carry no citation key
+_SPECIAL_HEAD_RE = re.compile(r"@(comment|string|preamble)\s*([{(])", re.IGNORECASE)
+_DATE_PART_RE = re.compile(r"(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?")
+_YEAR_RE = re.compile(r"\d{4}")
+_FIELD_NAME_RE = re.compile(r"(\w+)\s*=\s*")
+
+
+class Diagnostic(NamedTuple):
+    """A lint finding at a 1-based ``line``/``col`` of the bib file."""
+    line: int
+    col: int
+    message: str
+
+
+def _line_col(content: str, pos: int) -> tuple[int, int]:
+    """1-based line and column of offset *pos* (only computed when reporting)."""
+    line_start = content.rfind("\n", 0, pos) + 1
+    return content.count("\n", 0, pos) + 1, pos - line_start + 1
+
+
+def _valid_date(value: str) -> bool:
+    """True for ``YYYY[-MM[-DD]]`` and ranges of those joined by ``/``."""
+    for part in value.split("/"):
+        m = _DATE_PART_RE.fullmatch(part)
+        if not m:
+            return False
+        year, month, day = m.groups()
+        try:
+            datetime(int(year), int(month or 1), int(day or 1))
+        except ValueError:
+            return False
+    return True
+
+
+def parse_bib(bib_path: Path, lint: Optional[list[Diagnostic]] = None) -> list[dict]:
     """Parse a .bib file into a list of entry dicts.
 
     Each dict has special keys ``_type`` (entry type) and ``_key`` (citation key),
-    plus all fields found in the entry (lowercased field names).
+    plus all fields found in the entry (lowercased field names).  ``@comment``,
+    ``@string`` and ``@preamble`` blocks are skipped.
+
+    Pass a list as *lint* to collect :class:`Diagnostic` records for unbalanced
+    braces, stray ``@``, duplicate keys, missing required fields and unparseable
+    dates.  The checks run inside the same scan, so linting adds no extra pass.
+    An entry left open by an unbalanced brace ends at the next line-leading
+    ``@type{key,`` instead of swallowing the rest of the file.
     """
     with open(bib_path, "r", encoding="utf-8") as fh:
         content = fh.read()
 
     entries: list[dict] = []
+    first_seen: dict[str, int] = {}
+    length = len(content)
+
+    def report(pos: int, message: str) -> None:
+        if lint is not None:
+            line, col = _line_col(content, pos)
+            lint.append(Diagnostic(line, col, message))
+
+    pos = content.find("@")
+    while pos >= 0:
+        # Skip commented-out entries (``% @article{...``)
+        line_start = content.rfind("\n", 0, pos) + 1
+        if content[line_start:pos].lstrip().startswith("%"):
+            eol = content.find("\n", pos)
+            pos = content.find("@", eol) if eol >= 0 else -1
+            continue
 
-    # Match @type{key,
-    for match in re.finditer(r"@(\w+)\{\s*([^,\s]+)\s*,", content):
+        # Skip @comment / @string / @preamble blocks (balanced body, no key)
+        special = _SPECIAL_HEAD_RE.match(content, pos)
+        if special:
+            close = _matching_close(content, special.end() - 1)
+            if close < 0:
+                report(pos, f"unbalanced braces: '@{special.group(1).lower()}' is not "
+                            f"closed before end of file")
+                break
+            pos = content.find("@", close + 1)
+            continue
+
+        # Match @type{key,
+        match = _ENTRY_HEAD_RE.match(content, pos)
+        if not match:
+            report(pos, "stray '@' outside an entry (expected '@type{key,')")
+            pos = content.find("@", pos + 1)
+            continue
         entry_type = match.group(1).lower()
         entry_key = match.group(2).strip()
 
         # Walk forward from just after the comma to find the matching closing brace
         start = match.end()
         depth = 1
-        pos = start
-        while pos < len(content) and depth > 0:
-            ch = content[pos]
+        i = start
+        end = -1
+        while i < length:
+            ch = content[i]
             if ch == "{":
                 depth += 1
             elif ch == "}":
                 depth -= 1
-            pos += 1
+                if depth == 0:
+                    end = i
+                    break
+            elif ch == "@" and (_ENTRY_HEAD_RE.match(content, i)
+                                or _SPECIAL_HEAD_RE.match(content, i)):
+                line_start = content.rfind("\n", 0, i) + 1
+                if not content[line_start:i].strip():
+                    report(pos, f"unbalanced braces: '{entry_key}' is not closed "
+                                f"before the next entry")
+                    end = line_start
+                    break
+                report(i, f"stray '@' inside '{entry_key}' looks like an entry header")
+            i += 1
+        if end < 0:
+            report(pos, f"unbalanced braces: '{entry_key}' is not closed before end of file")
+            end = length
 
-        entry_body = content[start : pos - 1]
-        fields = _parse_fields(entry_body)
+        positions: dict[str, int] = {}
+        fields = _parse_fields(content[start:end], positions)
         fields["_type"] = entry_type
         fields["_key"] = entry_key
         entries.append(fields)
 
+        if lint is not None:
+            _lint_entry(fields, pos, {f: start + p for f, p in positions.items()},
+                        first_seen, content, report)
+
+        pos = content.find("@", end + 1 if end < length and content[end] == "}" else end)
+
     return entries
 
 
-def _parse_fields(body: str) -> dict:
+def _matching_close(content: str, open_pos: int) -> int:
+    """Index of the delimiter closing the ``{`` or ``(`` at *open_pos*, or -1."""
+    opener = content[open_pos]
+    closer = "}" if opener == "{" else ")"
+    depth = 0
+    for i in range(open_pos, len(content)):
+        ch = content[i]
+        if ch == opener:
+            depth += 1
+        elif ch == closer:
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def _lint_entry(fields: dict, pos: int, positions: dict[str, int],
+                first_seen: dict[str, int], content: str,
+                report: Callable[[int, str], None]) -> None:
+    """Per-entry checks: duplicate key, required fields, date syntax."""
+    key = fields["_key"]
+    if key in first_seen:
+        line, _ = _line_col(content, first_seen[key])
+        report(pos, f"duplicate key '{key}' (first defined on line {line})")
+    else:
+        first_seen[key] = pos
+
+    for keyword in entry_keywords(fields):
+        for required in REQUIRED_FIELDS.get(keyword, ()):
+            options = required if isinstance(required, tuple) else (required,)
+            if not any(fields.get(f) for f in options):
+                report(pos, f"'{key}' ({keyword}) is missing {' or '.join(options)}")
+
+    for raw in _author_parts(fields.get("author", "")):
+        if raw.lower() != _ET_AL and not parse_name(raw).last:
+            report(positions["author"], f"'{key}' has an empty name {raw!r} in author")
+
+    if "date" in fields and not _valid_date(fields["date"]):
+        report(positions["date"], f"'{key}' has an unparseable date {fields['date']!r}")
+    if "year" in fields and not _YEAR_RE.fullmatch(fields["year"]):
+        report(positions["year"], f"'{key}' has an unparseable year {fields['year']!r}")
+
+
+def _parse_fields(body: str, positions: Optional[dict[str, int]] = None) -> dict:
     """Extract field = {value} pairs from a bib entry body.
 
     Handles ``field = {value}`` and ``field = "value"`` forms.
-    Multi-line braced values are preserved (newlines kept).
+    Multi-line braced values are preserved (newlines kept).  If *positions*
+    is given, it receives the offset of each field's value within *body*.
     """
     fields: dict = {}
     i = 0
@@ -100,15 +264,17 @@ def _parse_fields(body: str) -> dict:
             continue
 
         # Expect: fieldname = ...
-        m = re.match(r"(\w+)\s*=\s*", body[i:])
+        m = _FIELD_NAME_RE.match(body, i)
         if not m:
             i += 1
             continue
 
         field_name = m.group(1).lower()
-        i += m.end()
+        i = m.end()
         if i >= length:
             break
+        if positions is not None:
+            positions[field_name] = i
 
         # Parse value (braced, quoted, or bare)
         if body[i] == "{":
@@ -144,19 +310,28 @@ def _parse_fields(body: str) -> dict:
 # LaTeX → plain-text / Markdown helpers
 # ---------------------------------------------------------------------------
 
-def clean_latex(text: str) -> str:
-    """Convert common LaTeX markup to Markdown / plain text."""
-    if not text:
-        return text
+# Applied in order by clean_latex (compiled once at import)
+_LATEX_SUBS = [
     # \textbf{...} → **...**
-    text = re.sub(r"\\textbf\{([^}]*)\}", r"**\1**", text)
+    (re.compile(r"\\textbf\{([^}]*)\}"), r"**\1**"),
     # \textit{...} / \emph{...} → *...*
-    text = re.sub(r"\\textit\{([^}]*)\}", r"*\1*", text)
-    text = re.sub(r"\\emph\{([^}]*)\}", r"*\1*", text)
+    (re.compile(r"\\textit\{([^}]*)\}"), r"*\1*"),
+    (re.compile(r"\\emph\{([^}]*)\}"), r"*\1*"),
     # \textsuperscript{...} → <sup>...</sup>
-    text = re.sub(r"\\textsuperscript\{([^}]*)\}", r"<sup>\1</sup>", text)
+    (re.compile(r"\\textsuperscript\{([^}]*)\}"), r"<sup>\1</sup>"),
     # Strip grouping braces {FooBar} → FooBar (not nested)
-    text = re.sub(r"\{([^{}]*)\}", r"\1", text)
+    (re.compile(r"\{([^{}]*)\}"), r"\1"),
+]
+# Stray LaTeX commands we don't handle
+_LATEX_COMMAND_RE = re.compile(r"\\[a-zA-Z]+\s*")
+
+
+def clean_latex(text: str) -> str:
+    """Convert common LaTeX markup to Markdown / plain text."""
+    if not text:
+        return text
+    for pattern, repl in _LATEX_SUBS:
+        text = pattern.sub(repl, text)
     # ~ → non-breaking space (just use regular space in markdown)
     text = text.replace("~", " ")
     # --- → em-dash (must come before --)
@@ -166,7 +341,7 @@ def clean_latex(text: str) -> str:
     # \% → %
     text = text.replace("\\%", "%")
     # Remove stray LaTeX commands we don't handle
-    text = re.sub(r"\\[a-zA-Z]+\s*", "", text)
+    text = _LATEX_COMMAND_RE.sub("", text)
     return text.strip()
 
 
@@ -222,14 +397,9 @@ def get_year(entry: dict) -> str:
 # Filtering & sorting
 # ---------------------------------------------------------------------------
 
-def filter_by_keyword(entries: list[dict], keyword: str) -> list[dict]:
-    """Return entries whose ``keywords`` field contains *keyword*."""
-    result = []
-    for e in entries:
-        kw_list = [k.strip() for k in e.get("keywords", "").split(",")]
-        if keyword in kw_list:
-            result.append(e)
-    return result
+def entry_keywords(entry: dict) -> list[str]:
+    """Return the comma-separated ``keywords`` of an entry as a list (no repeats)."""
+    return list(dict.fromkeys(k.strip() for k in entry.get("keywords", "").split(",")))
 
 
 def sort_by_year_desc(entries: list[dict]) -> list[dict]:
@@ -237,9 +407,298 @@ def sort_by_year_desc(entries: list[dict]) -> list[dict]:
     return sorted(entries, key=lambda e: get_year(e), reverse=True)
 
 
-def bold_author(author_str: str) -> str:
-    """Bold the target author name in an author string."""
-    return author_str.replace(BOLD_NAME, f"**{BOLD_NAME}**")
+# ---------------------------------------------------------------------------
+# Section registry — one pass over entries feeds every registered section
+# ---------------------------------------------------------------------------
+
+class Section(NamedTuple):
+    """A generated ``_includes/`` partial and the keywords it is built from.
+
+    ``render`` receives ``{keyword: sorted entries}`` for every keyword in
+    ``keywords`` and returns the markdown body of ``filename``.
+    """
+    filename: str
+    keywords: tuple[str, ...]
+    render: Callable[[dict[str, list[dict]]], str]
+    sort: Optional[Callable[[list[dict]], list[dict]]] = sort_by_year_desc
+
+
+SECTIONS: list[Section] = []
+
+
+def section(
+    filename: str,
+    *keywords: str,
+    sort: Optional[Callable[[list[dict]], list[dict]]] = sort_by_year_desc,
+):
+    """Register the decorated renderer as the section written to *filename*.
+
+    Adding a page section is just::
+
+        @section("talks_content.md", "talk")
+        def generate_talks(groups): ...
+    """
+    def decorator(render: Callable[[dict[str, list[dict]]], str]):
+        SECTIONS.append(Section(filename, keywords, render, sort))
+        return render
+    return decorator
+
+
+def section_name(sec: Section) -> str:
+    """Short CLI name of a section: ``software_content.md`` → ``software``."""
+    return sec.filename.removesuffix(".md").removesuffix("_content")
+
+
+def index_by_keyword(entries: list[dict]) -> dict[str, list[dict]]:
+    """Bucket entries by keyword in a single pass (bib order is preserved)."""
+    by_keyword: dict[str, list[dict]] = {}
+    for e in entries:
+        for kw in entry_keywords(e):
+            if kw:
+                by_keyword.setdefault(kw, []).append(e)
+    return by_keyword
+
+
+def render_sections(
+    by_keyword: dict[str, list[dict]],
+    sections: list[Section] = SECTIONS,
+) -> dict[str, str]:
+    """Render every section from the keyword index → ``{filename: markdown}``.
+
+    Each ``(keyword, sort)`` bucket is sorted once and shared between the
+    sections that ask for it, so the work is proportional to the entries and
+    emitted rows rather than to the number of registered sections.
+    """
+    sorted_buckets: dict[tuple, list[dict]] = {}
+    rendered: dict[str, str] = {}
+    for sec in sections:
+        groups: dict[str, list[dict]] = {}
+        for kw in sec.keywords:
+            cache_key = (kw, sec.sort)
+            if cache_key not in sorted_buckets:
+                bucket = by_keyword.get(kw, [])
+                sorted_buckets[cache_key] = sec.sort(bucket) if sec.sort else bucket
+            groups[kw] = sorted_buckets[cache_key]
+        rendered[sec.filename] = sec.render(groups)
+    return rendered
+
+
+# ---------------------------------------------------------------------------
+# Author names — BibTeX ``and``-separated name lists
+# ---------------------------------------------------------------------------
+
+class Name(NamedTuple):
+    """One parsed BibTeX name (``First von Last, Jr``) plus its display text."""
+    first: str
+    von: str
+    last: str
+    jr: str
+    display: str
+
+
+_AND_SPLIT_RE = re.compile(r"\s+and\s+", re.IGNORECASE)
+_NAME_TOKEN_RE = re.compile(r"[\s~]+")
+# ``and others`` is BibTeX for "et al.", not a person
+_ET_AL = "others"
+_COMMA_RE = re.compile(",")
+
+# Interned names: each distinct raw name string is parsed exactly once per run
+_NAME_CACHE: dict[str, Name] = {}
+
+
+def _split_top_level(text: str, sep_re: re.Pattern) -> list[str]:
+    """Split *text* on *sep_re* matches that are not inside ``{...}`` groups."""
+    parts: list[str] = []
+    depth = 0
+    start = 0
+    pos = 0
+    while pos < len(text):
+        ch = text[pos]
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+        elif depth == 0:
+            m = sep_re.match(text, pos)
+            if m and m.end() > pos:
+                parts.append(text[start:pos])
+                start = pos = m.end()
+                continue
+        pos += 1
+    parts.append(text[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _is_von_token(token: str) -> bool:
+    """BibTeX rule: a 'von' token starts with a lowercase letter (outside braces)."""
+    return token[:1].islower()
+
+
+def parse_name(raw: str) -> Name:
+    """Parse one BibTeX name into its First / von / Last / Jr parts.
+
+    Supports the three BibTeX forms ``First von Last``, ``von Last, First`` and
+    ``von Last, Jr, First``.  Braced groups such as ``{Bhat Kapu}`` are kept as
+    a single token.  Results are interned, so repeated names cost one lookup.
+    """
+    cached = _NAME_CACHE.get(raw)
+    if cached is not None:
+        return cached
+
+    commas = _split_top_level(raw, _COMMA_RE)
+    tokens = [_split_top_level(part, _NAME_TOKEN_RE) for part in commas]
+
+    first: list[str] = []
+    von: list[str] = []
+    last: list[str] = []
+    jr: list[str] = []
+    if not tokens:
+        pass  # nothing but commas: an empty name, skipped by parse_names
+    elif len(tokens) == 1:
+        words = tokens[0]
+        # von starts at the first lowercase token, Last is always non-empty
+        von_start = next((i for i, w in enumerate(words[:-1]) if _is_von_token(w)), None)
+        if von_start is None:
+            first, von, last = words[:-1], [], words[-1:]
+        else:
+            von_end = max(i for i, w in enumerate(words[:-1]) if _is_von_token(w)) + 1
+            first, von, last = words[:von_start], words[von_start:von_end], words[von_end:]
+    else:
+        head = tokens[0]
+        von_end = 0
+        for i, w in enumerate(head[:-1]):
+            if _is_von_token(w):
+                von_end = i + 1
+        von, last = head[:von_end], head[von_end:]
+        if len(tokens) == 2:
+            first = tokens[1]
+        else:
+            jr, first = tokens[1], tokens[2]
+
+    name = Name(
+        first=clean_latex(" ".join(first)),
+        von=clean_latex(" ".join(von)),
+        last=clean_latex(" ".join(last)),
+        jr=clean_latex(" ".join(jr)),
+        display=clean_latex(raw),
+    )
+    _NAME_CACHE[raw] = name
+    return name
+
+
+def _author_parts(author_field: str) -> list[str]:
+    """Raw names of an ``and``-separated author field (``others`` included)."""
+    return _split_top_level(author_field, _AND_SPLIT_RE) if author_field else []
+
+
+def has_et_al(author_field: str) -> bool:
+    """Return True if the author list ends in ``and others``."""
+    parts = _author_parts(author_field)
+    return bool(parts) and parts[-1].lower() == _ET_AL
+
+
+def parse_names(author_field: str) -> list[Name]:
+    """Parse an ``and``-separated BibTeX author field into :class:`Name` tuples.
+
+    ``others`` (see :func:`has_et_al`) and empty names such as a lone ``,`` are
+    skipped.
+    """
+    names = (parse_name(raw) for raw in _author_parts(author_field)
+             if raw.lower() != _ET_AL)
+    return [n for n in names if n.last]
+
+
+def _name_words(part: str) -> list[str]:
+    """Lowercased words of a name part; dots and hyphens split (``S.B.`` → ``s b``)."""
+    return part.replace("-", " ").replace(".", " ").lower().split()
+
+
+@lru_cache(maxsize=None)
+def names_match(name: Name, target: Name) -> bool:
+    """Return True if *name* is a variant of *target*.
+
+    The surname of *name* must include *target*'s final surname word, every
+    word of *name* must be used up, and together they must cover every word
+    of *target* — given names in full or as initials.  So ``Kapu, S. B.``,
+    ``S.B. Kapu``, ``Bhat Kapu, Shrikrishna`` and ``Shrikrishna {Bhat Kapu}``
+    all match ``Shrikrishna Bhat Kapu``, while ``Kapu``, ``Shrikrishna`` and
+    ``Bhat, S.`` do not.
+    """
+    surname = _name_words(" ".join((name.von, name.last)))
+    pool = _name_words(" ".join((target.first, target.von, target.last)))
+    if not surname or not pool or pool[-1] not in surname:
+        return False
+    for word in surname:
+        if word not in pool:
+            return False
+        pool.remove(word)
+    for word in _name_words(name.first):
+        hit = next(
+            (w for w in pool if w == word or (len(word) == 1 and w.startswith(word))),
+            None,
+        )
+        if hit is None:
+            return False
+        pool.remove(hit)
+    return not pool
+
+
+def name_key(name: Name) -> str:
+    """Index key for a name: ``surname|given names``, normalised.
+
+    Different people who share a surname and initials keep separate keys; only
+    the highlighted author's variants are folded onto a single key.
+    """
+    if is_highlighted(name):
+        name = _BOLD_TARGET
+    surname = " ".join(_name_words(" ".join((name.von, name.last))))
+    return f"{surname}|{' '.join(_name_words(name.first))}"
+
+
+_BOLD_TARGET = parse_name(BOLD_NAME)
+
+
+def is_highlighted(name: Name) -> bool:
+    """Return True if *name* is any variant of :data:`BOLD_NAME`."""
+    return names_match(name, _BOLD_TARGET)
+
+
+class AuthorEntries(NamedTuple):
+    """One name-index bucket: the first-seen form of the name and its entries."""
+    name: Name
+    entries: list[dict]
+
+
+def build_name_index(entries: list[dict]) -> dict[str, AuthorEntries]:
+    """Build a name-key → :class:`AuthorEntries` index in a single pass over *entries*.
+
+    Look names up with :func:`name_key`, so co-author tallies never have to
+    rescan the bibliography.
+    """
+    index: dict[str, AuthorEntries] = {}
+    for e in entries:
+        seen: set[str] = set()
+        for name in parse_names(e.get("author", "")):
+            key = name_key(name)
+            if key not in seen:
+                seen.add(key)
+                index.setdefault(key, AuthorEntries(name, [])).entries.append(e)
+    return index
+
+
+# Index key every variant of the highlighted author folds onto
+_BOLD_KEY = name_key(_BOLD_TARGET)
+
+
+def bold_author(author_field: str) -> str:
+    """Render a raw bib author field, bolding every variant of the target author."""
+    names = [
+        f"**{n.display}**" if name_key(n) == _BOLD_KEY else n.display
+        for n in parse_names(author_field)
+    ]
+    if has_et_al(author_field):
+        names.append(_ET_AL)
+    return " and ".join(names)
 
 
 # Bib 'file' fields are relative to the CVShrikrishnaBhat folder
@@ -272,13 +731,14 @@ def _get_pub_type_label(entry: dict) -> str:
     return "PREPRINTS"
 
 
-def generate_publications(entries: list[dict]) -> str:
+@section("publications_content.md", "pub")
+def generate_publications(groups: dict[str, list[dict]]) -> str:
     """Generate markdown for the Publications page.
 
     Produces compact numbered reference entries (like a CV bibliography)
     where each title links to its own detail page.
     """
-    pubs = sort_by_year_desc(filter_by_keyword(entries, "pub"))
+    pubs = groups["pub"]
 
     articles = [e for e in pubs if e["_type"] == "article"]
     preprints = [e for e in pubs if e["_type"] != "article"]
@@ -300,27 +760,28 @@ def generate_publications(entries: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def generate_publication_pages(entries: list[dict]) -> None:
+def generate_publication_pages(pubs: list[dict]) -> None:
     """Generate individual .qmd detail pages for each publication.
 
-    Creates ``publications/<bib_key>/index.qmd`` for every entry tagged with
-    the ``pub`` keyword.  Each page shows the full bibliographic metadata in
-    a card layout (like Rob Hyndman's site), plus abstract and download links.
-    Pages are regenerated on every pre-render run, so adding a new bib entry
-    with ``keywords = {pub}`` is all that's needed.
+    Creates ``publications/<bib_key>/index.qmd`` for every entry in *pubs*
+    (the ``pub`` keyword bucket).  Each page shows the full bibliographic
+    metadata in a card layout (like Rob Hyndman's site), plus abstract and
+    download links.  Pages are regenerated on every pre-render run, so adding
+    a new bib entry with ``keywords = {pub}`` is all that's needed; pages whose
+    content is unchanged are left untouched.
     """
-    pubs = filter_by_keyword(entries, "pub")
     PUB_PAGES_DIR.mkdir(exist_ok=True)
 
+    written = 0
     for entry in pubs:
         bib_key = entry["_key"]
         page_dir = PUB_PAGES_DIR / bib_key
         page_dir.mkdir(exist_ok=True)
 
         qmd_content = _build_detail_page(entry)
-        (page_dir / "index.qmd").write_text(qmd_content, encoding="utf-8")
+        written += write_if_changed(page_dir / "index.qmd", qmd_content)
 
-    print(f"[generate_pages]   → Generated {len(pubs)} publication detail pages")
+    print(f"[generate_pages]   → Generated {len(pubs)} publication detail pages ({written} written)")
 
 
 def _build_detail_page(entry: dict) -> str:
@@ -448,7 +909,7 @@ def _fmt_publication_bullet(entry: dict, index: int) -> str:
     Mirrors the numbered bibliography style used in the LaTeX CV.
     """
     title = clean_latex(entry.get("title", "Untitled"))
-    author = bold_author(clean_latex(entry.get("author", "")))
+    author = bold_author(entry.get("author", ""))
     year = get_year(entry)
     journal = clean_latex(entry.get("journal", ""))
     volume = entry.get("volume", "")
@@ -500,23 +961,111 @@ def _fmt_publication_bullet(entry: dict, index: int) -> str:
     return "\n".join(lines)
 
 
+# ---------------------------------------------------------------------------
+# Abstracts — inline, or lazy-loaded per-entry JSON
+# ---------------------------------------------------------------------------
+
+ABSTRACTS_DIR = PROJECT_DIR / "abstracts"
+
+# "inline": abstracts are part of the page (default).
+# "lazy":   each abstract goes to abstracts/<key>.json and the page carries a
+#           collapsed stub that fetches it when opened (``--abstracts lazy``).
+ABSTRACT_MODE = "inline"
+
+# Abstract HTML collected while rendering in lazy mode: {bib key: html}
+_LAZY_ABSTRACTS: dict[str, str] = {}
+
+# Loads an abstract the first time its stub is opened (emitted once per partial)
+ABSTRACT_LOADER = """<script>
+document.addEventListener("toggle", function (ev) {
+  var d = ev.target;
+  if (!d.matches || !d.matches("details.abstract-stub") || !d.open || d.dataset.loaded) return;
+  d.dataset.loaded = "1";
+  fetch(d.dataset.src).then(function (r) { return r.json(); }).then(function (a) {
+    d.querySelector(".abstract-body").innerHTML = a.html;
+  }).catch(function () { delete d.dataset.loaded; });
+}, true);
+</script>
+"""
+
+_MD_STRONG_RE = re.compile(r"\*\*(.+?)\*\*")
+_MD_EM_RE = re.compile(r"\*(.+?)\*")
+_SUP_ESCAPED_RE = re.compile(r"&lt;(/?sup)&gt;")
+
+
+def abstract_html(text: str) -> str:
+    """Render a ``clean_latex`` abstract (bold, italics, ``<sup>``) as HTML paragraphs."""
+    import html
+
+    text = _SUP_ESCAPED_RE.sub(r"<\1>", html.escape(text, quote=False))
+    text = _MD_EM_RE.sub(r"<em>\1</em>", _MD_STRONG_RE.sub(r"<strong>\1</strong>", text))
+    return "".join(f"<p>{p.strip()}</p>" for p in text.split("\n\n") if p.strip())
+
+
+def abstract_block(entry: dict, abstract: str, label: str = "Abstract") -> str:
+    """The abstract as page content, or a collapsed stub in lazy mode."""
+    if ABSTRACT_MODE != "lazy":
+        return abstract
+    key = entry["_key"]
+    _LAZY_ABSTRACTS[key] = abstract_html(abstract)
+    return (
+        f'<details class="abstract-stub" data-src="{ABSTRACTS_DIR.name}/{key}.json">'
+        f'<summary>{label}</summary><div class="abstract-body"></div></details>'
+    )
+
+
+def add_abstract_loader(lines: list[str]) -> None:
+    """Append the loader script if any line of a partial holds an abstract stub."""
+    if ABSTRACT_MODE == "lazy" and any('class="abstract-stub"' in line for line in lines):
+        lines.append(ABSTRACT_LOADER)
+
+
+def write_abstract_files(prune: bool = False) -> tuple[int, int]:
+    """Write ``abstracts/<key>.json`` for every collected abstract.
+
+    With *prune*, files for entries that no longer have an abstract are
+    removed (only safe after a full run); after an inline run that is all of
+    them, and the emptied directory goes too.  Returns ``(written, removed)``.
+    """
+    import json
+
+    written = removed = 0
+    if _LAZY_ABSTRACTS:
+        ABSTRACTS_DIR.mkdir(exist_ok=True)
+    for key, body in _LAZY_ABSTRACTS.items():
+        content = json.dumps({"key": key, "html": body}, ensure_ascii=False)
+        written += write_if_changed(ABSTRACTS_DIR / f"{key}.json", content + "\n")
+    if prune and ABSTRACTS_DIR.is_dir():
+        for path in ABSTRACTS_DIR.glob("*.json"):
+            if path.stem not in _LAZY_ABSTRACTS:
+                path.unlink()
+                removed += 1
+        if not any(ABSTRACTS_DIR.iterdir()):
+            ABSTRACTS_DIR.rmdir()
+    return written, removed
+
+
 # ---------------------------------------------------------------------------
 # Content generators — Software
 # ---------------------------------------------------------------------------
 
-def generate_software(entries: list[dict]) -> str:
+_PKGDOWN_URL_RE = re.compile(r"https://([^.]+)\.github\.io/([^/]+)")
+
+
+@section("software_content.md", "software")
+def generate_software(groups: dict[str, list[dict]]) -> str:
     """Generate markdown for the Software page."""
-    software = sort_by_year_desc(filter_by_keyword(entries, "software"))
     lines: list[str] = []
-    for e in software:
+    for e in groups["software"]:
         lines.append(_fmt_software(e))
+    add_abstract_loader(lines)
     return "\n".join(lines)
 
 
 def _fmt_software(entry: dict) -> str:
     """Format one software entry with cards for links."""
     title = clean_latex(entry.get("title", "Untitled"))
-    author = bold_author(clean_latex(entry.get("author", "")))
+    author = bold_author(entry.get("author", ""))
     note = clean_latex(entry.get("note", ""))
     doi = entry.get("doi", "")
     url = entry.get("url", "")
@@ -536,8 +1085,7 @@ def _fmt_software(entry: dict) -> str:
     # Derive GitHub user/repo from pkgdown URL (https://user.github.io/repo)
     github_repo = ""
     if url:
-        import re as _re
-        m = _re.match(r"https://([^.]+)\.github\.io/([^/]+)", url)
+        m = _PKGDOWN_URL_RE.match(url)
         if m:
             github_repo = f"{m.group(1)}/{m.group(2)}"
 
@@ -602,7 +1150,7 @@ def _fmt_software(entry: dict) -> str:
 
     # Description / abstract
     if abstract:
-        lines.append(f"### Description\n\n{abstract}\n")
+        lines.append(f"### Description\n\n{abstract_block(entry, abstract, 'Show description')}\n")
 
     # Installation snippet
     if eprinttype == "cran" and eprint:
@@ -623,11 +1171,12 @@ def _fmt_software(entry: dict) -> str:
 # Content generators — Conferences
 # ---------------------------------------------------------------------------
 
-def generate_conferences(entries: list[dict]) -> str:
+@section("conferences_content.md", "present", "poster", "part")
+def generate_conferences(groups: dict[str, list[dict]]) -> str:
     """Generate markdown for the Conferences page."""
-    presentations = sort_by_year_desc(filter_by_keyword(entries, "present"))
-    posters = sort_by_year_desc(filter_by_keyword(entries, "poster"))
-    participated = sort_by_year_desc(filter_by_keyword(entries, "part"))
+    presentations = groups["present"]
+    posters = groups["poster"]
+    participated = groups["part"]
 
     lines: list[str] = []
 
@@ -652,6 +1201,7 @@ def generate_conferences(entries: list[dict]) -> str:
             lines.append(_fmt_conference(e))
         lines.append(":::\n")
 
+    add_abstract_loader(lines)
     return "\n".join(lines)
 
 
@@ -691,7 +1241,7 @@ def _fmt_conference(entry: dict) -> str:
         lines.append(f"\n*{note}*")
 
     if abstract:
-        lines.append(f"\n{abstract}")
+        lines.append(f"\n{abstract_block(entry, abstract)}")
 
     if file_path and file_exists(file_path):
         resolved = resolve_file_path(file_path)
@@ -752,14 +1302,13 @@ def _sort_by_date_desc(entries: list[dict]) -> list[dict]:
 # Content generators — Education
 # ---------------------------------------------------------------------------
 
-def generate_education(entries: list[dict]) -> str:
+@section("education_content.md", "education", sort=_sort_by_date_desc)
+def generate_education(groups: dict[str, list[dict]]) -> str:
     """Generate timeline markdown for the Education section of cv.qmd."""
-    edu = _sort_by_date_desc(filter_by_keyword(entries, "education"))
-
     lines: list[str] = []
     lines.append("::: {.tl-table}\n")
 
-    for e in edu:
+    for e in groups["education"]:
         lines.append(_fmt_education(e))
 
     lines.append(":::\n")
@@ -809,14 +1358,13 @@ def _fmt_education(entry: dict) -> str:
 # Content generators — Experience
 # ---------------------------------------------------------------------------
 
-def generate_experience(entries: list[dict]) -> str:
+@section("experience_content.md", "experience", sort=_sort_by_date_desc)
+def generate_experience(groups: dict[str, list[dict]]) -> str:
     """Generate timeline markdown for the Experience page."""
-    exp = _sort_by_date_desc(filter_by_keyword(entries, "experience"))
-
     lines: list[str] = []
     lines.append("::: {.tl-table}\n")
 
-    for e in exp:
+    for e in groups["experience"]:
         lines.append(_fmt_experience(e))
 
     lines.append(":::\n")
@@ -869,35 +1417,199 @@ def _fmt_experience(entry: dict) -> str:
 # Content generators — Research output counts
 # ---------------------------------------------------------------------------
 
-def generate_research_counts(entries: list[dict]) -> str:
+# Keyword → research-output category; ``pub`` splits into articles and preprints
+STATS_CATEGORIES = {
+    "pub": None,
+    "software": "software",
+    "present": "present",
+    "poster": "poster",
+}
+
+# Rows shown per ranked list (venues, co-authors) on the research page
+STATS_TOP_N = 5
+
+# Cached stats are keyed on this script too, so changing the tallies
+# invalidates them automatically
+STATS_CACHE_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+# In-process memo: cache key → stats
+_STATS_MEMO: dict[str, dict] = {}
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _stats_category(keyword: str, entry: dict) -> str:
+    if keyword == "pub":
+        return "articles" if entry["_type"] == "article" else "preprints"
+    return STATS_CATEGORIES[keyword]
+
+
+def _stats_venue(keyword: str, entry: dict) -> str:
+    """Journal for publications, conference name for talks/posters, else ''.
+
+    Returned as plain text (``3<sup>rd</sup>`` → ``3rd``) for chart labels.
+    """
+    if keyword == "pub":
+        venue = entry.get("journal", "")
+    elif keyword in ("present", "poster"):
+        venue = entry.get("booktitle", "") or entry.get("howpublished", "")
+    else:
+        return ""
+    return _HTML_TAG_RE.sub("", clean_latex(venue))
+
+
+def entry_set_hash(groups: dict[str, list[dict]]) -> str:
+    """Hash of the (keyword, entry) pairs the stats are computed from."""
+    digest = hashlib.sha256()
+    for kw in STATS_CATEGORIES:
+        for e in groups.get(kw, []):
+            digest.update(f"{kw}:{entry_hash(e)}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def research_stats(groups: dict[str, list[dict]], cache_file: Optional[Path] = None) -> dict:
+    """All research-output tallies in one pass over the keyword buckets.
+
+    Returns ``{"totals", "by_year", "venues", "coauthors"}``, where
+    ``by_year`` maps year → category → count.  Results are cached in memory
+    and in *cache_file* under the hash of the entry set and of this script,
+    so an unchanged bibliography skips the work entirely.  *cache_file*
+    defaults to ``STATS_CACHE_FILE``.
+    """
+    import json
+
+    cache_file = cache_file or STATS_CACHE_FILE
+    key = f"{STATS_CACHE_VERSION}:{entry_set_hash(groups)}"
+    if key in _STATS_MEMO:
+        return _STATS_MEMO[key]
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if cached.get("hash") == key:
+            return _STATS_MEMO.setdefault(key, cached["stats"])
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    totals = dict.fromkeys(("articles", "preprints", "software", "present", "poster"), 0)
+    by_year: dict[str, dict[str, int]] = {}
+    venues: dict[str, int] = {}
+    research: dict[int, dict] = {}
+
+    for kw in STATS_CATEGORIES:
+        for e in groups.get(kw, []):
+            category = _stats_category(kw, e)
+            totals[category] += 1
+            year = get_year(e) or "n.d."
+            by_year.setdefault(year, {}).setdefault(category, 0)
+            by_year[year][category] += 1
+            venue = _stats_venue(kw, e)
+            if venue:
+                venues[venue] = venues.get(venue, 0) + 1
+            research.setdefault(id(e), e)
+
+    # Co-authors straight from the name index (one bucket per distinct person)
+    coauthors = {
+        bucket.name.display: len(bucket.entries)
+        for key, bucket in build_name_index(list(research.values())).items()
+        if key != _BOLD_KEY
+    }
+
+    def _ranked(counts: dict[str, int]) -> list:
+        return sorted(([k, n] for k, n in counts.items()), key=lambda r: (-r[1], r[0]))
+
+    stats = {
+        "totals": totals,
+        "by_year": {y: by_year[y] for y in sorted(by_year)},
+        "venues": _ranked(venues),
+        "coauthors": _ranked(coauthors),
+    }
+    _STATS_MEMO[key] = stats
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps({"hash": key, "stats": stats}), encoding="utf-8")
+    return stats
+
+
+def stats_series(stats: dict) -> dict:
+    """Chart-ready form: one list per category, aligned with ``years``."""
+    years = list(stats["by_year"])
+    return {
+        "years": years,
+        "series": {
+            cat: [stats["by_year"][y].get(cat, 0) for y in years]
+            for cat in stats["totals"]
+        },
+        "totals": stats["totals"],
+        "venues": stats["venues"],
+        "coauthors": stats["coauthors"],
+    }
+
+
+def export_research_stats(groups: dict[str, list[dict]], path: Path = STATS_FILE) -> bool:
+    """Write the compact JSON series for charts (only if it changed)."""
+    import json
+
+    content = json.dumps(stats_series(research_stats(groups)), ensure_ascii=False,
+                         separators=(",", ":"))
+    return write_if_changed(path, content + "\n")
+
+
+@section("research_counts.md", "pub", "software", "present", "poster", sort=None)
+def generate_research_counts(groups: dict[str, list[dict]]) -> str:
     """Generate a markdown table of research output counts."""
-    pubs = filter_by_keyword(entries, "pub")
-    n_articles = sum(1 for e in pubs if e["_type"] == "article")
-    n_preprints = sum(1 for e in pubs if e["_type"] != "article")
-    n_software = len(filter_by_keyword(entries, "software"))
-    n_present = len(filter_by_keyword(entries, "present"))
-    n_poster = len(filter_by_keyword(entries, "poster"))
+    totals = research_stats(groups)["totals"]
 
     lines = [
         "| Type | Count |",
         "|---|---|",
-        f"| Peer-reviewed journal articles | {n_articles} |",
-        f"| Preprints | {n_preprints} |",
-        f"| R packages (CRAN / GitHub) | {n_software} |",
-        f"| Conference papers presented | {n_present} |",
-        f"| Poster presentations | {n_poster} |",
+        f"| Peer-reviewed journal articles | {totals['articles']} |",
+        f"| Preprints | {totals['preprints']} |",
+        f"| R packages (CRAN / GitHub) | {totals['software']} |",
+        f"| Conference papers presented | {totals['present']} |",
+        f"| Poster presentations | {totals['poster']} |",
     ]
     return "\n".join(lines)
 
 
+@section("research_breakdown.md", "pub", "software", "present", "poster", sort=None)
+def generate_research_breakdown(groups: dict[str, list[dict]]) -> str:
+    """Generate per-year counts and the top venues and co-authors."""
+    stats = research_stats(groups)
+    if not stats["by_year"]:
+        return ""
+
+    columns = {
+        "articles": "Articles",
+        "preprints": "Preprints",
+        "software": "Software",
+        "present": "Talks",
+        "poster": "Posters",
+    }
+    lines = [
+        "### By Year",
+        "",
+        "| Year | " + " | ".join(columns.values()) + " |",
+        "|---|" + "---|" * len(columns),
+    ]
+    for year in reversed(stats["by_year"]):
+        counts = stats["by_year"][year]
+        lines.append(f"| {year} | " + " | ".join(str(counts.get(c, 0)) for c in columns) + " |")
+
+    for heading, ranked in (("Top Venues", stats["venues"]),
+                            ("Frequent Co-authors", stats["coauthors"])):
+        if ranked:
+            lines += ["", f"### {heading}", ""]
+            lines += [f"- {label} ({n})" for label, n in ranked[:STATS_TOP_N]]
+    return "\n".join(lines)
+
+
 # ---------------------------------------------------------------------------
 # Content generators — Publications list for the publications page sidebar
 # ---------------------------------------------------------------------------
 
-def generate_pub_conference_list(entries: list[dict]) -> str:
+@section("pub_conference_list.md", "present", "poster")
+def generate_pub_conference_list(groups: dict[str, list[dict]]) -> str:
     """Short numbered list of conference papers for the publications page."""
-    presentations = sort_by_year_desc(filter_by_keyword(entries, "present"))
-    posters = sort_by_year_desc(filter_by_keyword(entries, "poster"))
+    presentations = groups["present"]
+    posters = groups["poster"]
 
     lines: list[str] = []
 
@@ -935,39 +1647,308 @@ def generate_pub_conference_list(entries: list[dict]) -> str:
 
 
 # ---------------------------------------------------------------------------
-# Main
+# Export — CSL-JSON of the parsed bibliography
 # ---------------------------------------------------------------------------
 
-def main():
-    """Entry point — parse bib, generate all content partials."""
-    INCLUDES_DIR.mkdir(exist_ok=True)
+# BibTeX entry type → CSL type (entries tagged ``software`` become "software")
+CSL_TYPES = {
+    "article": "article-journal",
+    "online": "article",
+    "inproceedings": "paper-conference",
+    "misc": "document",
+}
 
-    entries = parse_bib(BIB_FILE)
-    print(f"[generate_pages] Parsed {len(entries)} entries from {BIB_FILE.name}")
+# Cleaned bib field → CSL variable
+CSL_FIELDS = {
+    "title": "title",
+    "journal": "container-title",
+    "booktitle": "container-title",
+    "howpublished": "container-title",
+    "volume": "volume",
+    "number": "issue",
+    "pages": "page",
+    "note": "note",
+    "abstract": "abstract",
+    "address": "publisher-place",
+    "institution": "publisher",
+}
+
+# Raw (not LaTeX-cleaned) bib field → CSL variable
+CSL_RAW_FIELDS = {"doi": "DOI", "url": "URL"}
+
+
+def parse_date_parts(date_str: str) -> list[list[int]]:
+    """Parse ``YYYY[-MM[-DD]][/YYYY[-MM[-DD]]]`` into CSL ``date-parts``.
+
+    Returns an empty list when any part is not numeric.
+    """
+    parts: list[list[int]] = []
+    for piece in date_str.split("/"):
+        segs = piece.strip().split("-")
+        if not all(seg.isdigit() for seg in segs):
+            return []
+        parts.append([int(seg) for seg in segs])
+    return parts
+
+
+def _csl_name(name: Name) -> dict:
+    """Convert a parsed :class:`Name` to a CSL name object."""
+    csl = {"family": name.last}
+    if name.first:
+        csl["given"] = name.first
+    if name.von:
+        csl["non-dropping-particle"] = name.von
+    if name.jr:
+        csl["suffix"] = name.jr
+    return csl
+
+
+def to_csl(entry: dict) -> dict:
+    """Convert one parsed bib entry into a CSL-JSON item.
+
+    Bib-only data (keyword list, entry type, ``file``, ``eprint`` …) goes under
+    CSL's ``custom`` object so downstream tools never need the raw .bib.
+    """
+    keywords = [k for k in entry_keywords(entry) if k]
+    csl_type = "software" if "software" in keywords else CSL_TYPES.get(entry["_type"], "document")
+    item: dict = {"id": entry["_key"], "type": csl_type}
+
+    authors = parse_names(entry.get("author", ""))
+    if authors:
+        item["author"] = [_csl_name(n) for n in authors]
+
+    for field, var in CSL_FIELDS.items():
+        if field in entry and var not in item:
+            item[var] = clean_latex(entry[field])
+    for field, var in CSL_RAW_FIELDS.items():
+        if field in entry:
+            item[var] = entry[field]
+
+    date_parts = parse_date_parts(entry.get("date", "")) or parse_date_parts(entry.get("year", ""))
+    if date_parts:
+        item["issued"] = {"date-parts": date_parts}
+    if keywords:
+        item["keyword"] = ", ".join(keywords)
+
+    custom: dict = {"bibtype": entry["_type"], "keywords": keywords}
+    for field in ("file", "eprint", "eprinttype"):
+        if field in entry:
+            custom[field] = entry[field]
+    if "description" in entry:
+        custom["description"] = [clean_latex(p.strip()) for p in entry["description"].split("||")]
+    item["custom"] = custom
+    return item
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write *content* to *path* unless the file already holds exactly that.
+
+    Leaving unchanged files untouched keeps their mtimes stable, so Quarto and
+    git see no spurious changes.  Returns True if the file was written.
+    """
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
+def export_csl_json(entries: list[dict], path: Path = EXPORT_FILE) -> bool:
+    """Write all entries as compact CSL-JSON to *path* (only if it changed)."""
+    import json
+    content = json.dumps(
+        [to_csl(e) for e in entries], ensure_ascii=False, separators=(",", ":")
+    )
+    return write_if_changed(path, content + "\n")
+
+
+# ---------------------------------------------------------------------------
+# Publication manifest — per-entry content hashes for sitemap lastmod & feed
+# ---------------------------------------------------------------------------
+
+def entry_hash(entry: dict) -> str:
+    """Stable content hash of a parsed bib entry."""
+    import json
+    raw = json.dumps(entry, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
 
-    # Disable markdownlint for auto-generated include partials
-    ML_DISABLE = "<!-- markdownlint-disable -->\n\n"
-
-    content_map = {
-        "publications_content.md": generate_publications(entries),
-        "software_content.md": generate_software(entries),
-        "conferences_content.md": generate_conferences(entries),
-        "research_counts.md": generate_research_counts(entries),
-        "pub_conference_list.md": generate_pub_conference_list(entries),
-        "education_content.md": generate_education(entries),
-        "experience_content.md": generate_experience(entries),
+
+def load_manifest(path: Path = MANIFEST_FILE) -> dict[str, dict]:
+    """Load the previous publication manifest (empty if missing or unreadable)."""
+    import json
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def published_date(entry: dict) -> str:
+    """Publication date of *entry* as an Atom timestamp, from ``date`` or ``year``.
+
+    Missing month/day default to 1; returns '' when neither field parses.
+    """
+    parts = parse_date_parts(entry.get("date", "")) or parse_date_parts(get_year(entry))
+    if not parts:
+        return ""
+    start = parts[0] + [1, 1]
+    try:
+        return datetime(*start[:3], tzinfo=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    except ValueError:
+        return ""
+
+
+def _manifest_record(entry: dict, digest: str, now: str, published: str) -> dict:
+    """Build the manifest record for a new or changed publication."""
+    return {
+        "hash": digest,
+        "url": f"publications/{entry['_key']}/",
+        "title": clean_latex(entry.get("title", "Untitled")),
+        "authors": [n.display for n in parse_names(entry.get("author", ""))],
+        "summary": clean_latex(entry.get("abstract", "")),
+        "published": published,
+        "lastmod": now,
     }
 
-    for filename, content in content_map.items():
-        filepath = INCLUDES_DIR / filename
-        filepath.write_text(ML_DISABLE + content, encoding="utf-8")
-        print(f"[generate_pages]   → {filepath.relative_to(PROJECT_DIR)}")
 
-    # Generate individual publication detail pages
-    generate_publication_pages(entries)
+def update_publication_manifest(pubs: list[dict], path: Path = MANIFEST_FILE) -> int:
+    """Refresh ``publications_manifest.json`` from the ``pub`` entries.
+
+    Records whose entry hash is unchanged are carried over from the previous
+    manifest, so their ``lastmod`` stays put.  New or edited entries get the
+    current UTC time as ``lastmod``; ``published`` always comes from the
+    entry's own ``date``/``year`` (first-seen time only when it has neither).
+    Entries removed from the bib are dropped.  The
+    post-render step (``update_sitemap.py``) turns this into sitemap
+    ``<lastmod>`` values and the publications feed.  Returns the number of
+    new or changed records.
+    """
+    import json
+
+    previous = load_manifest(path)
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    manifest: dict[str, dict] = {}
+    changed = 0
+
+    for entry in pubs:
+        key = entry["_key"]
+        digest = entry_hash(entry)
+        old = previous.get(key)
+        published = published_date(entry) or (old or {}).get("published", now)
+        if old and old.get("hash") == digest:
+            manifest[key] = {**old, "published": published}
+            continue
+        manifest[key] = _manifest_record(entry, digest, now, published)
+        changed += 1
+
+    content = json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True)
+    write_if_changed(path, content + "\n")
+    return changed
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def _parse_args(argv: Optional[list[str]]):
+    import argparse
+
+    names = [section_name(sec) for sec in SECTIONS]
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--only", metavar="SECTIONS", type=lambda v: v.split(","),
+                        help=f"comma-separated partials to write: {', '.join(names)}")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--pages-only", action="store_true",
+                      help="write only the publication detail pages")
+    mode.add_argument("--partials-only", action="store_true",
+                      help="write only the _includes/ partials")
+    mode.add_argument("--lint", action="store_true",
+                      help=f"only check {BIB_FILE.name}; exit 1 on any warning")
+    parser.add_argument("--abstracts", choices=("inline", "lazy"), default=ABSTRACT_MODE,
+                        help="inline abstracts, or write them to abstracts/*.json and "
+                             f"load on demand (default {ABSTRACT_MODE})")
+    parser.add_argument("--key", metavar="BIBKEY",
+                        help="regenerate only the outputs that show this entry")
+    args = parser.parse_args(argv)
+    if args.only and args.pages_only:
+        parser.error("--only selects partials; it cannot be combined with --pages-only")
+    unknown = sorted(set(args.only or ()) - set(names))
+    if unknown:
+        parser.error(f"unknown section(s) {', '.join(unknown)}; choose from {', '.join(names)}")
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Entry point — parse bib, generate the selected content partials and pages."""
+    global ABSTRACT_MODE
+
+    args = _parse_args(argv)
+    ABSTRACT_MODE = args.abstracts
+    INCLUDES_DIR.mkdir(exist_ok=True)
+
+    diagnostics: list[Diagnostic] = []
+    entries = parse_bib(BIB_FILE, lint=diagnostics)
+    print(f"[generate_pages] Parsed {len(entries)} entries from {BIB_FILE.name}")
+    for d in diagnostics:
+        print(f"[generate_pages] {BIB_FILE.name}:{d.line}:{d.col}: warning: {d.message}")
+    if args.lint:
+        return 1 if diagnostics else 0
+
+    # Single pass over the entries; every registered section reads its buckets
+    by_keyword = index_by_keyword(entries)
+
+    sections = SECTIONS
+    if args.only:
+        sections = [sec for sec in sections if section_name(sec) in args.only]
+    pubs = by_keyword.get("pub", [])
+    if args.key:
+        entry = next((e for e in entries if e["_key"] == args.key), None)
+        if entry is None:
+            print(f"[generate_pages] No entry '{args.key}' in {BIB_FILE.name}")
+            return 1
+        keywords = set(entry_keywords(entry))
+        sections = [sec for sec in sections if keywords & set(sec.keywords)]
+        pubs = [e for e in pubs if e is entry]
+    full_run = not (args.only or args.key or args.pages_only)
+
+    if not args.pages_only:
+        # Disable markdownlint for auto-generated include partials
+        ML_DISABLE = "<!-- markdownlint-disable -->\n\n"
+
+        content_map = render_sections(by_keyword, sections)
+        for filename, content in content_map.items():
+            filepath = INCLUDES_DIR / filename
+            status = "written" if write_if_changed(filepath, ML_DISABLE + content) else "unchanged"
+            print(f"[generate_pages]   → {filepath.relative_to(PROJECT_DIR)} ({status})")
+
+        if any(sec.render is generate_research_counts for sec in sections):
+            # Chart-ready series from the same (cached) aggregation as the table
+            status = "written" if export_research_stats(by_keyword) else "unchanged"
+            print(f"[generate_pages]   → {STATS_FILE.relative_to(PROJECT_DIR)} ({status})")
+
+        # A full inline run prunes files left over from an earlier lazy run
+        if ABSTRACT_MODE == "lazy" or (full_run and ABSTRACTS_DIR.is_dir()):
+            written, removed = write_abstract_files(prune=full_run)
+            print(f"[generate_pages]   → {ABSTRACTS_DIR.relative_to(PROJECT_DIR)}/ "
+                  f"({len(_LAZY_ABSTRACTS)} abstracts, {written} written, {removed} removed)")
+
+        if full_run:
+            # Machine-readable export for listings, the CV build and other scripts
+            status = "written" if export_csl_json(entries) else "unchanged"
+            print(f"[generate_pages]   → {EXPORT_FILE.relative_to(PROJECT_DIR)} ({status})")
+
+    if not (args.partials_only or args.only) and (pubs or not args.key):
+        # Generate individual publication detail pages
+        generate_publication_pages(pubs)
+
+        # Content-hash manifest consumed by the post-render sitemap/feed step
+        changed = update_publication_manifest(by_keyword.get("pub", []))
+        print(f"[generate_pages]   → {MANIFEST_FILE.relative_to(PROJECT_DIR)} ({changed} new/changed)")
 
     print("[generate_pages] Done!")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
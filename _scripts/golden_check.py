@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+golden_check.py — Golden-output harness for the bib → markdown generator.
+
+Runs ``generate_pages.py``'s parser and renderers over every fixture bib in
+``_scripts/golden/`` and compares each output byte for byte with the stored
+snapshot in ``_scripts/golden/<fixture>/``:
+
+- every ``_includes`` partial (``<name>.md``),
+- every publication detail page (``publications/<key>/index.qmd``),
+- the lint diagnostics (``lint.txt``).
+
+The fixtures cover nested braces, quoted and bare values, ``%`` comments and
+``@comment``/``@string``/``@preamble`` blocks, date ranges, missing fields and every
+lint error, plus a copy of the site's own bibliography.  Nothing
+in the real tree is written.
+
+Each run is timed (best of ``--repeat``) per stage, so a faster implementation
+of any ``generate_pages`` helper can be checked and measured side by side with
+the current one::
+
+    python _scripts/golden_check.py --engine parse_bib=fastbib:parse_bib
+
+runs every fixture once with the stock functions and once with
+``generate_pages.parse_bib`` replaced by ``fastbib.parse_bib``.  Helpers are
+looked up at call time, so any module-level function can be swapped
+(``clean_latex``, ``_fmt_software``, …); swapping a section renderer such as
+``generate_software`` also replaces it in the ``SECTIONS`` registry.
+
+Usage:
+    python _scripts/golden_check.py [fixture ...]      # compare with snapshots
+    python _scripts/golden_check.py --update           # accept current output
+    python _scripts/golden_check.py --repeat 20 --engine NAME=module:attr
+
+Exits with status 1 if any output differs from its snapshot.
+"""
+
+import argparse
+import contextlib
+import difflib
+import importlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import generate_pages as gp
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+GOLDEN_DIR = gp.SCRIPT_DIR / "golden"
+
+# Lines of unified diff shown per differing file
+MAX_DIFF_LINES = 40
+
+STAGES = ("parse", "render", "pages")
+
+
+# ---------------------------------------------------------------------------
+# Running the generator
+# ---------------------------------------------------------------------------
+
+def _reset_caches(stats_cache: Path) -> None:
+    """Forget everything memoised by a previous run, so timings are cold."""
+    gp._NAME_CACHE.clear()
+    cache_clear = getattr(gp.names_match, "cache_clear", None)  # absent once swapped
+    if cache_clear:
+        cache_clear()
+    gp._STATS_MEMO.clear()
+    gp._LAZY_ABSTRACTS.clear()
+    stats_cache.unlink(missing_ok=True)
+
+
+def run_fixture(bib: Path) -> tuple[dict[str, str], dict[str, float]]:
+    """Generate every output for *bib* in memory → ``(outputs, seconds per stage)``."""
+    timings: dict[str, float] = {}
+    outputs: dict[str, str] = {}
+
+    start = time.perf_counter()
+    diagnostics: list[gp.Diagnostic] = []
+    entries = gp.parse_bib(bib, lint=diagnostics)
+    timings["parse"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    by_keyword = gp.index_by_keyword(entries)
+    outputs.update(gp.render_sections(by_keyword))
+    timings["render"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for entry in by_keyword.get("pub", []):
+        outputs[f"publications/{entry['_key']}/index.qmd"] = gp._build_detail_page(entry)
+    timings["pages"] = time.perf_counter() - start
+
+    outputs["lint.txt"] = "".join(f"{d.line}:{d.col}: {d.message}\n" for d in diagnostics)
+    return outputs, timings
+
+
+def timed_run(bib: Path, repeat: int, stats_cache: Path):
+    """Run *bib* *repeat* times; return the outputs and the best time per stage."""
+    best = dict.fromkeys(STAGES, float("inf"))
+    outputs: dict[str, str] = {}
+    for _ in range(repeat):
+        _reset_caches(stats_cache)
+        outputs, timings = run_fixture(bib)
+        for stage in STAGES:
+            best[stage] = min(best[stage], timings[stage])
+    return outputs, best
+
+
+def load_engine(spec: str) -> tuple[str, object]:
+    """``NAME=module:attr`` → ``(NAME, object)``."""
+    name, _, target = spec.partition("=")
+    module, _, attr = target.partition(":")
+    if not (name and module and attr):
+        raise ValueError(f"expected NAME=module:attr, got {spec!r}")
+    if not hasattr(gp, name):
+        raise ValueError(f"generate_pages has no attribute {name!r}")
+    return name, getattr(importlib.import_module(module), attr)
+
+
+@contextlib.contextmanager
+def patched(patches: dict[str, object]):
+    """Swap ``generate_pages`` attributes (and registered sections) for the block."""
+    originals = {name: getattr(gp, name) for name in patches}
+    sections = list(gp.SECTIONS)
+    for name, obj in patches.items():
+        setattr(gp, name, obj)
+        # SECTIONS holds the renderer objects themselves, not their names
+        for i, sec in enumerate(gp.SECTIONS):
+            if sec.render is originals[name]:
+                gp.SECTIONS[i] = sec._replace(render=obj)
+    try:
+        yield
+    finally:
+        for name, obj in originals.items():
+            setattr(gp, name, obj)
+        gp.SECTIONS[:] = sections
+
+
+# ---------------------------------------------------------------------------
+# Snapshots
+# ---------------------------------------------------------------------------
+
+def read_snapshot(fixture: str) -> dict[str, str]:
+    snap_dir = GOLDEN_DIR / fixture
+    if not snap_dir.is_dir():
+        return {}
+    return {
+        p.relative_to(snap_dir).as_posix(): p.read_text(encoding="utf-8")
+        for p in sorted(snap_dir.rglob("*")) if p.is_file()
+    }
+
+
+def write_snapshot(fixture: str, outputs: dict[str, str]) -> None:
+    """Replace the snapshot of *fixture* with *outputs* (stale files are removed)."""
+    snap_dir = GOLDEN_DIR / fixture
+    for rel in read_snapshot(fixture).keys() - outputs.keys():
+        (snap_dir / rel).unlink()
+    for rel, content in outputs.items():
+        path = snap_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        gp.write_if_changed(path, content)
+    for d in sorted((p for p in snap_dir.rglob("*") if p.is_dir()), reverse=True):
+        if not any(d.iterdir()):
+            d.rmdir()
+
+
+def compare(expected: dict[str, str], actual: dict[str, str]) -> list[str]:
+    """Return a unified diff block for every missing, unexpected or changed output."""
+    problems: list[str] = []
+    for rel in sorted(expected.keys() | actual.keys()):
+        old, new = expected.get(rel), actual.get(rel)
+        if old == new:
+            continue
+        diff = list(difflib.unified_diff(
+            (old or "").splitlines(keepends=True), (new or "").splitlines(keepends=True),
+            fromfile=f"snapshot/{rel}" if old is not None else "/dev/null",
+            tofile=f"output/{rel}" if new is not None else "/dev/null",
+        ))
+        if len(diff) > MAX_DIFF_LINES:
+            diff = diff[:MAX_DIFF_LINES] + [f"... ({len(diff) - MAX_DIFF_LINES} more lines)\n"]
+        problems.append("".join(diff))
+    return problems
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point — run every fixture per engine, print the result/timing table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("fixtures", nargs="*",
+                        help="fixture names (default: every golden/*.bib)")
+    parser.add_argument("--update", action="store_true",
+                        help="overwrite the snapshots with the current output")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="runs per fixture; the best time is reported (default 5)")
+    parser.add_argument("--engine", action="append", default=[], metavar="NAME=module:attr",
+                        help="also run with generate_pages.NAME replaced (repeatable)")
+    parser.add_argument("--quiet", action="store_true", help="do not print diffs")
+    args = parser.parse_args(argv)
+
+    bibs = sorted(GOLDEN_DIR.glob("*.bib"))
+    if args.fixtures:
+        bibs = [b for b in bibs if b.stem in args.fixtures]
+        unknown = set(args.fixtures) - {b.stem for b in bibs}
+        if unknown:
+            parser.error(f"no fixture(s) {', '.join(sorted(unknown))} in {GOLDEN_DIR.name}/")
+
+    try:
+        engines = [("stock", {})] + [
+            (spec.split("=", 1)[1], dict([load_engine(spec)])) for spec in args.engine
+        ]
+    except (ValueError, ImportError, AttributeError) as exc:
+        parser.error(str(exc))
+
+    header = "".join(f"{s + ' ms':>10}" for s in STAGES + ("total",))
+    print(f"[golden_check] {'fixture':<16}{'engine':<28}{'outputs':>8}  {'result':<10}{header}")
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        gp.STATS_CACHE_FILE = Path(tmp) / "research_stats.json"
+        for bib in bibs:
+            expected = read_snapshot(bib.stem)
+            for label, patches in engines:
+                try:
+                    with patched(patches):
+                        outputs, best = timed_run(bib, max(args.repeat, 1), gp.STATS_CACHE_FILE)
+                except Exception as exc:  # report and carry on with the next run
+                    failures += 1
+                    print(f"[golden_check] {bib.stem:<16}{label:<28}{'-':>8}  ERROR     "
+                          f"{type(exc).__name__}: {exc}")
+                    continue
+
+                if args.update and not patches:
+                    write_snapshot(bib.stem, outputs)
+                    expected = outputs
+                    result, problems = "updated", []
+                else:
+                    problems = compare(expected, outputs)
+                    result = f"{len(problems)} diff" if problems else "ok"
+                    failures += bool(problems)
+
+                ms = [best[s] * 1000 for s in STAGES]
+                cols = "".join(f"{t:10.2f}" for t in ms + [sum(ms)])
+                print(f"[golden_check] {bib.stem:<16}{label:<28}{len(outputs):>8}  {result:<10}{cols}")
+                if problems and not args.quiet:
+                    for block in problems:
+                        print(block, end="" if block.endswith("\n") else "\n")
+
+    if failures:
+        print(f"[golden_check] {failures} run(s) differ from the snapshots"
+              f"{'' if args.update else '; rerun with --update to accept'}")
+        return 1
+    print(f"[golden_check] All {len(bibs)} fixtures match their snapshots")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
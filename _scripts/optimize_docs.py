@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""
+optimize_docs.py — Purge unused CSS and minify the rendered HTML in docs/.
+
+Every page loads the full Bootstrap builds (light and dark), bootstrap-icons.css and
+Quarto's own stylesheets, while the site only uses a small subset of their selectors.
+This post-render step:
+
+1. Collects every class and id used by the site — from the rendered HTML, from the
+   markdown partials written by generate_pages.py (``tl-row``, ``pub-meta-card``,
+   ``pkg-header`` …) and from any string in the site's JavaScript, so classes that
+   Bootstrap/Quarto toggle at runtime survive.
+2. Writes a purged, minified bundle ``<name>.purged.css`` next to every local
+   stylesheet (relative ``url()`` references keep working) and points the pages'
+   ``<link>`` tags at it.  The original files are left in place.
+3. Minifies every HTML page (comments and whitespace runs outside ``<pre>``,
+   ``<textarea>``, ``<script>`` and ``<style>``).
+
+Outputs are cached in ``_cache/optimize_docs/`` keyed on input hashes (and on this
+script itself), so a rerun over an unchanged site is just hashing; cache entries a
+run does not use are pruned.  A stylesheet that purging would not shrink keeps its
+original link.  A per-page before/after transfer size report (gzip bytes of the HTML
+plus its blocking stylesheets) is printed at the end.
+
+Usage:
+    python _scripts/optimize_docs.py
+
+Runs automatically via Quarto's post-render hook (see _quarto.yml).
+"""
+
+import gzip
+import hashlib
+import re
+from pathlib import Path
+
+from generate_pages import INCLUDES_DIR, PROJECT_DIR, write_if_changed
+from fingerprint_assets import is_fingerprinted
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+OUTPUT_DIR = PROJECT_DIR / "docs"
+CACHE_DIR = PROJECT_DIR / "_cache" / "optimize_docs"
+
+# Cached outputs are keyed on this script too, so editing the purge/minify
+# logic invalidates them automatically
+CACHE_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+PURGED_SUFFIX = ".purged.css"
+
+# Class prefixes added at runtime by Bootstrap / Quarto / search / tooltips
+SAFELIST_PREFIXES = (
+    "aa-", "quarto-", "tippy-", "headroom", "anchorjs", "code-copy",
+    "show", "showing", "hiding", "fade", "collaps", "active", "disabled",
+    "dropdown", "modal", "offcanvas", "tooltip", "popover", "bs-",
+)
+
+# At-rules whose block contains nested rules (purged recursively)
+GROUP_AT_RULES = ("@media", "@supports", "@container", "@layer", "@document")
+
+# ---------------------------------------------------------------------------
+# Used-selector collection
+# ---------------------------------------------------------------------------
+
+_CLASS_ATTR_RE = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+_ID_ATTR_RE = re.compile(r"""\bid\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+_WORD_RE = re.compile(r"-?[A-Za-z_][\w-]*")
+_MD_CLASS_RE = re.compile(r"(?<![\w)\]])\.([A-Za-z_][\w-]*)")
+
+
+def collect_used_tokens(html_pages: dict[Path, str], js_files: list[Path]) -> set[str]:
+    """Return every class / id name that may be matched at runtime."""
+    used: set[str] = set()
+    for html in html_pages.values():
+        for m in _CLASS_ATTR_RE.finditer(html):
+            used.update((m.group(1) or m.group(2) or "").split())
+        for m in _ID_ATTR_RE.finditer(html):
+            used.add((m.group(1) or m.group(2) or "").strip())
+        # Inline scripts may build class names too
+        for script in _SCRIPT_BODY_RE.findall(html):
+            used.update(_WORD_RE.findall(script))
+    for js in js_files:
+        used.update(_WORD_RE.findall(js.read_text(encoding="utf-8", errors="replace")))
+    # Classes emitted by generate_pages.py: {.tl-row}, class="pub-meta-card", …
+    for md in INCLUDES_DIR.glob("*.md"):
+        text = md.read_text(encoding="utf-8")
+        used.update(_MD_CLASS_RE.findall(text))
+        for m in _CLASS_ATTR_RE.finditer(text):
+            used.update((m.group(1) or m.group(2) or "").split())
+    used.discard("")
+    return used
+
+
+# ---------------------------------------------------------------------------
+# CSS parsing, purging and minification
+# ---------------------------------------------------------------------------
+
+_CSS_COMMENT_RE = re.compile(
+    r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*!.*?\*/)|/\*.*?\*/""", re.DOTALL
+)
+_CSS_WS_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|\s+""")
+_CSS_PUNCT_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|\s*([;:{},])\s*""")
+_ATTR_SEL_RE = re.compile(r"\[[^\]]*\]")
+_SEL_CLASS_RE = re.compile(r"\.(-?[A-Za-z_][\w-]*)")
+_SEL_ID_RE = re.compile(r"#(-?[A-Za-z_][\w-]*)")
+_PSEUDO_FN_RE = re.compile(r":(?:not|is|where|has|matches|-webkit-any|-moz-any)\(", re.IGNORECASE)
+
+
+def _strip_comments(css: str) -> tuple[str, list[str]]:
+    """Remove comments (string-aware); return the CSS and its ``/*! … */`` notices."""
+    notices: list[str] = []
+
+    def _sub(m: re.Match) -> str:
+        if m.group(1):
+            return m.group(1)
+        if m.group(2):
+            notices.append(m.group(2))
+        return ""
+
+    return _CSS_COMMENT_RE.sub(_sub, css), notices
+
+
+def _scan(css: str, i: int, stops: str) -> int:
+    """Return the index of the first char in *stops* at paren depth 0, skipping strings."""
+    depth = 0
+    n = len(css)
+    while i < n:
+        ch = css[i]
+        if ch in "\"'":
+            i += 1
+            while i < n and css[i] != ch:
+                i += 2 if css[i] == "\\" else 1
+        elif ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        elif depth <= 0 and ch in stops:
+            return i
+        i += 1
+    return n
+
+
+def _matching_brace(css: str, i: int) -> int:
+    """Return the index of the ``}`` closing the ``{`` at *i* (string-aware)."""
+    depth = 0
+    n = len(css)
+    while i < n:
+        ch = css[i]
+        if ch in "\"'":
+            i += 1
+            while i < n and css[i] != ch:
+                i += 2 if css[i] == "\\" else 1
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return n
+
+
+def parse_css(css: str, i: int = 0) -> tuple[list[tuple], int]:
+    """Parse CSS into nodes until the closing ``}`` of the current block.
+
+    Nodes are ``("stmt", text)``, ``("rule", selectors, body)``,
+    ``("atblock", prelude, body)`` (kept verbatim) and
+    ``("group", prelude, children)`` for nested at-rules.
+    """
+    nodes: list[tuple] = []
+    n = len(css)
+    while i < n:
+        while i < n and css[i].isspace():
+            i += 1
+        if i >= n:
+            break
+        if css[i] == "}":
+            return nodes, i + 1
+        j = _scan(css, i, "{;}")
+        prelude = css[i:j].strip()
+        if j >= n or css[j] in ";}":
+            if prelude:
+                nodes.append(("stmt", prelude))
+            i = j + 1 if j < n and css[j] == ";" else j
+            continue
+        if prelude.lower().startswith(GROUP_AT_RULES):
+            children, i = parse_css(css, j + 1)
+            nodes.append(("group", prelude, children))
+            continue
+        k = _matching_brace(css, j)
+        kind = "atblock" if prelude.startswith("@") else "rule"
+        nodes.append((kind, prelude, css[j + 1 : k]))
+        i = k + 1
+    return nodes, i
+
+
+def _split_selectors(prelude: str) -> list[str]:
+    """Split a selector list on top-level commas."""
+    parts: list[str] = []
+    i = 0
+    while i <= len(prelude):
+        j = _scan(prelude, i, ",")
+        parts.append(prelude[i:j].strip())
+        i = j + 1
+    return [p for p in parts if p]
+
+
+def _drop_pseudo_functions(selector: str) -> str:
+    """Remove ``:not(…)``/``:is(…)``/… arguments; they never require a class to exist."""
+    while True:
+        m = _PSEUDO_FN_RE.search(selector)
+        if not m:
+            return selector
+        end = _scan(selector, m.end(), ")")
+        selector = selector[: m.start()] + selector[end + 1 :]
+
+
+def _is_used(name: str, used: set[str]) -> bool:
+    return name in used or name.startswith(SAFELIST_PREFIXES)
+
+
+def selector_used(selector: str, used: set[str]) -> bool:
+    """True unless *selector* needs a class or id that the site never uses."""
+    if "\\" in selector:
+        return True  # escaped class names — keep rather than guess
+    core = _drop_pseudo_functions(_ATTR_SEL_RE.sub("", selector))
+    names = _SEL_CLASS_RE.findall(core) + _SEL_ID_RE.findall(core)
+    return all(_is_used(name, used) for name in names)
+
+
+def _minify_body(body: str) -> str:
+    """Collapse whitespace in a declaration block (string-aware)."""
+    body = _CSS_WS_RE.sub(lambda m: m.group(1) or " ", body).strip()
+    body = _CSS_PUNCT_RE.sub(lambda m: m.group(1) or m.group(2), body)
+    return body.rstrip(";")
+
+
+def purge_nodes(nodes: list[tuple], used: set[str]) -> list[str]:
+    """Serialise *nodes* minified, dropping rules and selectors the site never uses."""
+    out: list[str] = []
+    for node in nodes:
+        kind = node[0]
+        if kind == "stmt":
+            out.append(_minify_body(node[1]) + ";")
+        elif kind == "rule":
+            selectors = [s for s in _split_selectors(node[1]) if selector_used(s, used)]
+            if selectors:
+                sel = ",".join(" ".join(s.split()) for s in selectors)
+                out.append(f"{sel}{{{_minify_body(node[2])}}}")
+        elif kind == "atblock":
+            out.append(f"{' '.join(node[1].split())}{{{_minify_body(node[2])}}}")
+        else:
+            inner = purge_nodes(node[2], used)
+            if inner:
+                out.append(f"{' '.join(node[1].split())}{{{''.join(inner)}}}")
+    return out
+
+
+def purge_css(css: str, used: set[str]) -> str:
+    """Return *css* minified with every unused rule removed (``/*!`` notices kept)."""
+    stripped, notices = _strip_comments(css)
+    nodes, _ = parse_css(stripped)
+    return "\n".join(notices + ["".join(purge_nodes(nodes, used))]) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# HTML minification & stylesheet rewriting
+# ---------------------------------------------------------------------------
+
+_SCRIPT_BODY_RE = re.compile(r"<script\b[^>]*>(.*?)</script\s*>", re.DOTALL | re.IGNORECASE)
+_PRESERVE_RE = re.compile(
+    r"(<(pre|textarea|script|style)\b.*?</\2\s*>)", re.DOTALL | re.IGNORECASE
+)
+_HTML_COMMENT_RE = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+_LINK_TAG_RE = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+_HREF_RE = re.compile(r"""\bhref\s*=\s*(["'])([^"']+)\1""", re.IGNORECASE)
+_REL_RE = re.compile(r"""\brel\s*=\s*(["'])([^"']+)\1""", re.IGNORECASE)
+
+
+def minify_html(html: str) -> str:
+    """Strip comments and collapse whitespace outside whitespace-sensitive elements."""
+    pieces = _PRESERVE_RE.split(html)
+    out: list[str] = []
+    # split() yields [text, whole-match, tag-name, text, …]
+    for idx in range(0, len(pieces), 3):
+        text = _HTML_COMMENT_RE.sub("", pieces[idx])
+        text = re.sub(r"[ \t]*\n\s*", "\n", text)
+        text = re.sub(r"[ \t]{2,}", " ", text)
+        out.append(text)
+        if idx + 1 < len(pieces):
+            out.append(pieces[idx + 1])
+    return "".join(out).strip() + "\n"
+
+
+def _is_local(href: str) -> bool:
+    return not re.match(r"^(?:[a-z][a-z0-9+.-]*:|//|#)", href, re.IGNORECASE)
+
+
+def _resolve_local(page: Path, href: str) -> Path:
+    """Resolve a local href from *page*; root-relative hrefs start at OUTPUT_DIR."""
+    if href.startswith("/"):
+        return (OUTPUT_DIR / href.lstrip("/")).resolve()
+    return (page.parent / href).resolve()
+
+
+def _original_css(path: Path) -> Path:
+    """Map a ``*.purged.css`` bundle back to its source stylesheet."""
+    if path.name.endswith(PURGED_SUFFIX):
+        return path.with_name(path.name[: -len(PURGED_SUFFIX)] + ".css")
+    return path
+
+
+def _purged_name(href: str) -> str:
+    if href.endswith(PURGED_SUFFIX):
+        return href
+    return href[: -len(".css")] + PURGED_SUFFIX
+
+
+def _original_name(href: str) -> str:
+    if href.endswith(PURGED_SUFFIX):
+        return href[: -len(PURGED_SUFFIX)] + ".css"
+    return href
+
+
+def page_stylesheets(page: Path, html: str) -> list[tuple[Path, bool]]:
+    """Return ``(source stylesheet, is_blocking)`` for every local ``<link>`` CSS."""
+    sheets: list[tuple[Path, bool]] = []
+    for tag in _LINK_TAG_RE.findall(html):
+        href = _HREF_RE.search(tag)
+        if not href or not _is_local(href.group(2)):
+            continue
+        target = href.group(2).split("?")[0].split("#")[0]
+        if not target.endswith(".css") or is_fingerprinted(target):
+            continue
+        rel = _REL_RE.search(tag)
+        blocking = bool(rel) and rel.group(2).lower() == "stylesheet"
+        sheets.append((_original_css(_resolve_local(page, target)), blocking))
+    return sheets
+
+
+def rewrite_stylesheet_links(page: Path, html: str, bundled: set[Path]) -> str:
+    """Point every local stylesheet ``<link>`` whose source is in *bundled* at its purged
+    bundle, and every other one back at its original stylesheet."""
+    def _tag(m: re.Match) -> str:
+        tag = m.group(0)
+        href = _HREF_RE.search(tag)
+        if not href or not _is_local(href.group(2)) or not href.group(2).endswith(".css"):
+            return tag
+        if _original_css(_resolve_local(page, href.group(2))) in bundled:
+            new_href = _purged_name(href.group(2))
+        else:
+            new_href = _original_name(href.group(2))
+        return tag[: href.start(2)] + new_href + tag[href.end(2) :]
+    return _LINK_TAG_RE.sub(_tag, html)
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+def _digest(*parts: bytes) -> str:
+    h = hashlib.sha256(CACHE_VERSION.encode())
+    for part in parts:
+        h.update(hashlib.sha256(part).digest())
+    return h.hexdigest()
+
+
+# Cache files read or written by this run; everything else is pruned at the end
+_cache_used: set[Path] = set()
+
+
+def cached(key: str, suffix: str, build) -> str:
+    """Return the cached output for *key*, building (and storing) it on a miss."""
+    path = CACHE_DIR / f"{key}{suffix}"
+    _cache_used.add(path)
+    if path.is_file():
+        return path.read_text(encoding="utf-8")
+    result = build()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path.write_text(result, encoding="utf-8")
+    return result
+
+
+def prune_cache() -> int:
+    """Delete cache files this run did not use; return how many were removed."""
+    if not CACHE_DIR.is_dir():
+        return 0
+    stale = [p for p in CACHE_DIR.iterdir() if p.is_file() and p not in _cache_used]
+    for path in stale:
+        path.unlink()
+    return len(stale)
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+_gz_sizes: dict[str, int] = {}
+
+
+def transfer_size(text: str) -> int:
+    """Gzip size of *text* in bytes (what GitHub Pages actually sends)."""
+    key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    if key not in _gz_sizes:
+        _gz_sizes[key] = len(gzip.compress(text.encode("utf-8"), 6))
+    return _gz_sizes[key]
+
+
+def _kb(n: int) -> str:
+    return f"{n / 1024:8.1f}"
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    """Entry point — purge CSS bundles, minify pages, print the size report."""
+    if not OUTPUT_DIR.is_dir():
+        print(f"[optimize_docs] {OUTPUT_DIR.name}/ not found; render the site first")
+        return
+
+    pages = {p: p.read_text(encoding="utf-8") for p in sorted(OUTPUT_DIR.rglob("*.html"))}
+    js_files = sorted(OUTPUT_DIR.rglob("*.js"))
+    used = collect_used_tokens(pages, js_files)
+    used_digest = "\n".join(sorted(used)).encode("utf-8")
+    print(f"[optimize_docs] {len(pages)} pages, {len(used)} class/id tokens in use")
+
+    # 1. Purge every local stylesheet referenced by any page
+    page_sheets = {p: page_stylesheets(p, html) for p, html in pages.items()}
+    originals: dict[Path, str] = {}
+    purged: dict[Path, str] = {}
+    for sheet in sorted({s for sheets in page_sheets.values() for s, _ in sheets}):
+        if not sheet.is_file():
+            continue
+        css = sheet.read_text(encoding="utf-8")
+        originals[sheet] = css
+        key = _digest(css.encode("utf-8"), used_digest)
+        result = cached(key, ".css", lambda: purge_css(css, used))
+        out = sheet.with_name(sheet.stem + PURGED_SUFFIX)
+        if len(result) >= len(css):
+            # Nothing to gain: keep linking the original (and drop an old bundle)
+            out.unlink(missing_ok=True)
+            print(f"[optimize_docs]   = {sheet.relative_to(PROJECT_DIR)} "
+                  f"(kept, purge saves nothing at {len(css):,} bytes)")
+            continue
+        purged[sheet] = result
+        write_if_changed(out, result)
+        print(
+            f"[optimize_docs]   → {out.relative_to(PROJECT_DIR)} "
+            f"({len(css):,} → {len(result):,} bytes)"
+        )
+
+    # 2. Minify pages and point them at the purged bundles
+    print(f"[optimize_docs] {'page':<52} {'before KB':>9} {'after KB':>9} {'saved':>6}")
+    bundled = set(purged)
+    bundled_digest = "\n".join(sorted(str(s) for s in bundled)).encode("utf-8")
+    total_before = total_after = 0
+    for page, html in pages.items():
+        key = _digest(html.encode("utf-8"), str(page).encode("utf-8"), bundled_digest)
+        new_html = cached(
+            key, ".html", lambda: minify_html(rewrite_stylesheet_links(page, html, bundled))
+        )
+        write_if_changed(page, new_html)
+
+        blocking = [s for s, is_blocking in page_sheets[page] if is_blocking and s in purged]
+        before = transfer_size(html) + sum(transfer_size(originals[s]) for s in blocking)
+        after = transfer_size(new_html) + sum(transfer_size(purged[s]) for s in blocking)
+        total_before += before
+        total_after += after
+        saved = 100 * (before - after) / before if before else 0.0
+        rel = str(page.relative_to(OUTPUT_DIR))
+        print(f"[optimize_docs] {rel:<52} {_kb(before):>9} {_kb(after):>9} {saved:5.1f}%")
+
+    saved = 100 * (total_before - total_after) / total_before if total_before else 0.0
+    print(f"[optimize_docs] {'TOTAL':<52} {_kb(total_before):>9} {_kb(total_after):>9} {saved:5.1f}%")
+    print(f"[optimize_docs] {prune_cache()} stale cache files removed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+page_weight.py — Per-page weight report and budget gate for the rendered site.
+
+Parses every ``docs/**/*.html``, resolves every local asset the page loads or links to,
+and adds up the bytes per category:
+
+    html      the page itself
+    css       render-blocking stylesheets (``<link rel="stylesheet">``)
+    js        render-blocking scripts (``<script src>`` without async/defer)
+    deferred  async/defer scripts and prefetched stylesheets
+    images    ``<img>``/``<source>``/icons, plus ``url()`` images in the page's CSS
+    fonts     fonts referenced by the page's stylesheets
+    docs      linked documents: certificates and PDFs (``<a href>``, iframes, scripts)
+
+Linked documents are only downloaded when a visitor opens them, so they are reported
+but left out of the page total and never gated.
+
+Remote resources (CRAN badges, GitHub logos, web fonts) cannot be sized offline, so
+only their count is reported.
+
+Budgets (KB per category, and for the page total) are configured below in
+``BUDGETS``; ``PAGE_BUDGETS`` overrides them for individual pages.  With ``--check`` the
+script exits non-zero when any page is over budget, so a new bib entry cannot
+silently bloat a page.
+
+Usage:
+    python _scripts/page_weight.py            # report only
+    python _scripts/page_weight.py --check    # report, fail on budget overrun
+"""
+
+import argparse
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from generate_pages import PROJECT_DIR
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+OUTPUT_DIR = PROJECT_DIR / "docs"
+
+CATEGORIES = ("html", "css", "js", "deferred", "images", "fonts", "docs")
+
+# Reported per page, but not loaded with it — excluded from "total" and budgets
+REPORT_ONLY = ("docs",)
+
+# Budgets in KB (raw bytes on disk / 1024); "total" covers every loaded category
+BUDGETS = {
+    "html": 100,
+    "css": 250,     # purged bundles from optimize_docs.py
+    "js": 400,
+    "images": 600,
+    "total": 4000,
+}
+
+# Per-page overrides, keyed by path relative to docs/
+PAGE_BUDGETS: dict[str, dict[str, int]] = {
+    "index.html": {"images": 2500},   # profile photo
+}
+
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico", ".avif")
+FONT_SUFFIXES = (".woff", ".woff2", ".ttf", ".otf", ".eot")
+DOC_SUFFIXES = (".pdf", ".jpg", ".jpeg", ".png", ".docx", ".pptx", ".zip")
+
+_CSS_URL_RE = re.compile(r"""url\(\s*["']?([^"')]+?)["']?\s*\)""")
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_SCRIPT_DOC_RE = re.compile(
+    r"""["']([^"'<>\n]+?\.(?:%s))(?:[?#][^"'<>\n]*)?["']""" % "|".join(
+        s.lstrip(".") for s in DOC_SUFFIXES
+    ),
+    re.IGNORECASE,
+)
+
+
+# ---------------------------------------------------------------------------
+# HTML scanning
+# ---------------------------------------------------------------------------
+
+class _PageScanner(HTMLParser):
+    """Collect ``(category, url)`` pairs for everything a page loads or links to."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.refs: list[tuple[str, str]] = []
+        self._in_script = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        a = {k: (v or "") for k, v in attrs}
+        if tag == "link":
+            rel = a.get("rel", "").lower().split()
+            href = a.get("href", "")
+            if "stylesheet" in rel:
+                self.refs.append(("css", href))
+            elif {"prefetch", "preload"} & set(rel) and href.endswith(".css"):
+                self.refs.append(("deferred", href))
+            elif "icon" in rel:
+                self.refs.append(("images", href))
+        elif tag == "script":
+            self._in_script = True
+            if a.get("src"):
+                deferred = "async" in a or "defer" in a or a.get("type") == "module"
+                self.refs.append(("deferred" if deferred else "js", a["src"]))
+        elif tag in ("img", "source"):
+            if a.get("src"):
+                self.refs.append(("images", a["src"]))
+            for candidate in a.get("srcset", "").split(","):
+                if candidate.strip():
+                    self.refs.append(("images", candidate.split()[0]))
+        elif tag in ("a", "iframe", "embed", "object"):
+            url = a.get("href") or a.get("src") or a.get("data") or ""
+            if urlsplit(url).path.lower().endswith(DOC_SUFFIXES):
+                self.refs.append(("docs", url))
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script":
+            self._in_script = False
+
+    def handle_data(self, data: str) -> None:
+        # Documents loaded from inline scripts (e.g. the CV PDF viewer)
+        if self._in_script:
+            self.refs.extend(("docs", m.group(1)) for m in _SCRIPT_DOC_RE.finditer(data))
+
+
+def _is_remote(url: str) -> bool:
+    return bool(re.match(r"^(?:[a-z][a-z0-9+.-]*:|//)", url, re.IGNORECASE))
+
+
+def _resolve(base_dir: Path, url: str) -> Path | None:
+    """Resolve a local URL to a file under OUTPUT_DIR (None for fragments/data URIs)."""
+    path = unquote(urlsplit(url).path)
+    if not path:
+        return None
+    if path.startswith("/"):
+        return (OUTPUT_DIR / path.lstrip("/")).resolve()
+    return (base_dir / path).resolve()
+
+
+_css_refs: dict[Path, list[Path]] = {}
+
+
+def css_dependencies(css: Path) -> list[Path]:
+    """Local files referenced by ``url()`` in *css* (memoised across pages)."""
+    if css not in _css_refs:
+        text = _CSS_COMMENT_RE.sub("", css.read_text(encoding="utf-8", errors="replace"))
+        deps = []
+        for url in _CSS_URL_RE.findall(text):
+            if not _is_remote(url) and not url.startswith("#"):
+                dep = _resolve(css.parent, url)
+                if dep is not None:
+                    deps.append(dep)
+        _css_refs[css] = deps
+    return _css_refs[css]
+
+
+# ---------------------------------------------------------------------------
+# Weighing
+# ---------------------------------------------------------------------------
+
+def weigh_page(page: Path) -> tuple[dict[str, int], int, list[str]]:
+    """Return ``(bytes per category, remote resource count, missing files)`` for *page*."""
+    scanner = _PageScanner()
+    scanner.feed(page.read_text(encoding="utf-8"))
+
+    sizes = dict.fromkeys(CATEGORIES, 0)
+    sizes["html"] = page.stat().st_size
+    seen: set[Path] = set()
+    remote: set[str] = set()
+    missing: list[str] = []
+
+    def _add(category: str, path: Path) -> None:
+        if path in seen:
+            return
+        seen.add(path)
+        if not path.is_file():
+            root = OUTPUT_DIR.resolve()
+            missing.append(str(path.relative_to(root) if path.is_relative_to(root) else path))
+            return
+        sizes[category] += path.stat().st_size
+        if category in ("css", "deferred") and path.suffix == ".css":
+            for dep in css_dependencies(path):
+                suffix = dep.suffix.lower()
+                if suffix in FONT_SUFFIXES:
+                    _add("fonts", dep)
+                elif suffix in IMAGE_SUFFIXES:
+                    _add("images", dep)
+
+    for category, url in scanner.refs:
+        if not url or url.startswith(("#", "data:", "mailto:", "javascript:")):
+            continue
+        if _is_remote(url):
+            remote.add(url)
+            continue
+        path = _resolve(page.parent, url)
+        if path is not None:
+            _add(category, path)
+
+    return sizes, len(remote), missing
+
+
+def loaded_bytes(sizes: dict[str, int]) -> int:
+    """Bytes a visitor downloads to view the page (``REPORT_ONLY`` excluded)."""
+    return sum(n for cat, n in sizes.items() if cat not in REPORT_ONLY)
+
+
+def over_budget(rel: str, sizes: dict[str, int]) -> list[str]:
+    """Return ``"category: size > budget"`` messages for every exceeded budget."""
+    budgets = {**BUDGETS, **PAGE_BUDGETS.get(rel, {})}
+    totals = {**sizes, "total": loaded_bytes(sizes)}
+    return [
+        f"{cat}: {totals[cat] / 1024:.1f} KB > {limit} KB"
+        for cat, limit in budgets.items()
+        if cat not in REPORT_ONLY and totals.get(cat, 0) > limit * 1024
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point — print the weight table; with ``--check`` return 1 on overruns."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--check", action="store_true",
+                        help="exit with status 1 if any page exceeds its budget")
+    args = parser.parse_args(argv)
+
+    if not OUTPUT_DIR.is_dir():
+        print(f"[page_weight] {OUTPUT_DIR.name}/ not found; render the site first")
+        return 1
+
+    header = "".join(f"{c:>9}" for c in CATEGORIES + ("total",))
+    print(f"[page_weight] {'page (KB)':<48}{header}{'remote':>8}")
+
+    failures: list[str] = []
+    for page in sorted(OUTPUT_DIR.rglob("*.html")):
+        rel = page.relative_to(OUTPUT_DIR).as_posix()
+        sizes, n_remote, missing = weigh_page(page)
+        total = loaded_bytes(sizes)
+        cols = "".join(f"{sizes[c] / 1024:9.1f}" for c in CATEGORIES)
+        problems = over_budget(rel, sizes)
+        flag = " !" if problems else ""
+        print(f"[page_weight] {rel:<48}{cols}{total / 1024:9.1f}{n_remote:8d}{flag}")
+        for m in missing:
+            print(f"[page_weight]     missing: {m}")
+        failures.extend(f"{rel} — {p}" for p in problems)
+
+    if failures:
+        print(f"[page_weight] {len(failures)} budget(s) exceeded:")
+        for f in failures:
+            print(f"[page_weight]   {f}")
+        if args.check:
+            return 1
+    else:
+        print("[page_weight] All pages within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
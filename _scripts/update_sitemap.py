@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+update_sitemap.py — Stamp publication pages in docs/sitemap.xml and write a publications feed.
+
+Quarto stamps every sitemap ``<lastmod>`` with the render time, so crawlers re-fetch
+every ``publications/<key>/`` page after each build.  The pre-render script keeps
+``_includes/publications_manifest.json`` with a content hash and a ``lastmod`` per
+publication (unchanged entries are carried over from the previous manifest), and this
+post-render step copies those values into the sitemap and builds an Atom feed of
+publications at ``docs/publications.xml``.
+
+Usage:
+    python _scripts/update_sitemap.py
+
+Runs automatically via Quarto's post-render hook (see _quarto.yml).
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from generate_pages import BOLD_NAME, MANIFEST_FILE, PROJECT_DIR, load_manifest, write_if_changed
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+QUARTO_CONFIG = PROJECT_DIR / "_quarto.yml"
+OUTPUT_DIR = PROJECT_DIR / "docs"
+SITEMAP_FILE = OUTPUT_DIR / "sitemap.xml"
+FEED_FILE = OUTPUT_DIR / "publications.xml"
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+_SITE_URL_RE = re.compile(r"^\s*site-url:\s*[\"']?([^\"'\s#]+)", re.MULTILINE)
+_TITLE_RE = re.compile(r"^\s{2}title:\s*[\"']?(.*?)[\"']?\s*$", re.MULTILINE)
+
+
+def read_site_config(config: Path = QUARTO_CONFIG) -> tuple[str, str]:
+    """Return ``(site_url, site_title)`` from ``_quarto.yml`` (no YAML dependency)."""
+    text = config.read_text(encoding="utf-8")
+    url = _SITE_URL_RE.search(text)
+    title = _TITLE_RE.search(text)
+    return (url.group(1).rstrip("/") if url else ""), (title.group(1) if title else "")
+
+
+# ---------------------------------------------------------------------------
+# Sitemap
+# ---------------------------------------------------------------------------
+
+def update_sitemap(manifest: dict[str, dict], site_url: str, sitemap: Path = SITEMAP_FILE) -> int:
+    """Set ``<lastmod>`` of every publication page to its manifest value.
+
+    Pages missing from the sitemap are appended.  Returns the number of
+    publication URLs stamped.
+    """
+    ET.register_namespace("", SITEMAP_NS)
+    ns = {"sm": SITEMAP_NS}
+    if sitemap.is_file():
+        tree = ET.parse(sitemap)
+        root = tree.getroot()
+    else:
+        root = ET.Element(f"{{{SITEMAP_NS}}}urlset")
+        tree = ET.ElementTree(root)
+
+    by_loc = {
+        url.findtext("sm:loc", "", ns): url
+        for url in root.findall("sm:url", ns)
+    }
+
+    for record in manifest.values():
+        loc = f"{site_url}/{record['url']}index.html"
+        url = by_loc.get(loc)
+        if url is None:
+            url = ET.SubElement(root, f"{{{SITEMAP_NS}}}url")
+            ET.SubElement(url, f"{{{SITEMAP_NS}}}loc").text = loc
+        lastmod = url.find("sm:lastmod", ns)
+        if lastmod is None:
+            lastmod = ET.SubElement(url, f"{{{SITEMAP_NS}}}lastmod")
+        lastmod.text = record["lastmod"]
+
+    ET.indent(tree, space="  ")
+    content = ET.tostring(root, encoding="unicode", xml_declaration=False)
+    write_if_changed(sitemap, '<?xml version="1.0" encoding="UTF-8"?>\n' + content + "\n")
+    return len(manifest)
+
+
+# ---------------------------------------------------------------------------
+# Atom feed
+# ---------------------------------------------------------------------------
+
+def build_feed(manifest: dict[str, dict], site_url: str, site_title: str) -> str:
+    """Build an Atom feed of publications, newest first."""
+    records = sorted(manifest.values(), key=lambda r: (r["published"], r["url"]), reverse=True)
+    updated = max((r["lastmod"] for r in records), default="1970-01-01T00:00:00Z")
+
+    lines: list[str] = []
+    lines.append('<?xml version="1.0" encoding="UTF-8"?>')
+    lines.append('<feed xmlns="http://www.w3.org/2005/Atom">')
+    lines.append(f"<title>{escape(site_title)} — Publications</title>")
+    lines.append(f'<link href="{site_url}/publications.html"/>')
+    lines.append(f'<link rel="self" href="{site_url}/publications.xml"/>')
+    lines.append(f"<id>{site_url}/publications.xml</id>")
+    lines.append(f"<updated>{updated}</updated>")
+    # Feed-level author covers entries without one (required by Atom)
+    lines.append(f"<author><name>{escape(BOLD_NAME)}</name></author>")
+
+    for r in records:
+        link = f"{site_url}/{r['url']}"
+        lines.append("<entry>")
+        lines.append(f"<title>{escape(r['title'])}</title>")
+        lines.append(f'<link href="{link}"/>')
+        lines.append(f"<id>{link}</id>")
+        lines.append(f"<published>{r['published']}</published>")
+        lines.append(f"<updated>{r['lastmod']}</updated>")
+        for author in r["authors"]:
+            lines.append(f"<author><name>{escape(author)}</name></author>")
+        if r["summary"]:
+            lines.append(f"<summary>{escape(r['summary'])}</summary>")
+        lines.append("</entry>")
+
+    lines.append("</feed>")
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    """Entry point — stamp sitemap lastmod values and write the publications feed."""
+    manifest = load_manifest(MANIFEST_FILE)
+    if not manifest:
+        print(f"[update_sitemap] No {MANIFEST_FILE.name}; run generate_pages.py first")
+        return
+
+    site_url, site_title = read_site_config()
+    n = update_sitemap(manifest, site_url)
+    print(f"[update_sitemap]   → {SITEMAP_FILE.relative_to(PROJECT_DIR)} ({n} publication URLs)")
+
+    feed = build_feed(manifest, site_url, site_title)
+    status = "written" if write_if_changed(FEED_FILE, feed) else "unchanged"
+    print(f"[update_sitemap]   → {FEED_FILE.relative_to(PROJECT_DIR)} ({status})")
+
+
+if __name__ == "__main__":
+    main()